@@ -0,0 +1,53 @@
+import argparse
+import time
+
+from crossword import *
+from mac import MACCrosswordCreator
+
+
+class UnorderedCrosswordCreator(MACCrosswordCreator):
+    """
+    MAC solver that tries values in domain order, as a baseline for
+    least-constraining-value ordering.
+    """
+
+    def order_domain_values(self, var, assignment):
+        return list(self.domains[var])
+
+
+def run(creator_class, crossword, propagation):
+    """
+    Solve `crossword` once and return the solver statistics, whether a
+    solution was found, and the total time.
+    """
+    creator = creator_class(crossword, propagation)
+    start = time.perf_counter()
+    assignment = creator.solve()
+    elapsed = time.perf_counter() - start
+    return creator.stats, assignment is not None, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare search nodes with and without LCV ordering."
+    )
+    parser.add_argument("words")
+    parser.add_argument("structures", nargs="+")
+    parser.add_argument("--propagation", choices=["forward", "mac"], default="mac")
+    args = parser.parse_args()
+
+    print(f"{'structure':<24} {'ordering':<10} {'solved':<7} "
+          f"{'nodes':>8} {'backtracks':>10} {'seconds':>9}")
+    for structure in args.structures:
+        crossword = Crossword(structure, args.words)
+        for name, creator_class in [
+            ("lcv", MACCrosswordCreator),
+            ("none", UnorderedCrosswordCreator),
+        ]:
+            stats, solved, elapsed = run(creator_class, crossword, args.propagation)
+            print(f"{structure:<24} {name:<10} {str(solved):<7} "
+                  f"{stats['nodes']:>8} {stats['backtracks']:>10} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import sys
+from collections import Counter, deque
 
 from crossword import *
 
@@ -14,6 +15,18 @@ class CrosswordCreator():
             var: self.crossword.words.copy()
             for var in self.crossword.variables
         }
+        self.neighbors = self.neighbor_map()
+
+    def neighbor_map(self):
+        """
+        Return a dictionary mapping each variable to the set of variables
+        it overlaps with.
+        """
+        neighbors = {var: set() for var in self.crossword.variables}
+        for (x, y), overlap in self.crossword.overlaps.items():
+            if overlap is not None:
+                neighbors[x].add(y)
+        return neighbors
 
     def letter_grid(self, assignment):
         """
@@ -142,19 +155,29 @@ class CrosswordCreator():
         """
         if arcs == None:
             arcs = [
-                k
-                for k, v in self.crossword.overlaps.items()
-                if v != None
+                (x, y)
+                for x in self.neighbors
+                for y in self.neighbors[x]
             ]
 
-        while len(arcs) != 0:
-            u, v = arcs.pop()
+        # Each arc is queued at most once at a time
+        queue = deque()
+        queued = set()
+        for arc in arcs:
+            if arc not in queued:
+                queue.append(arc)
+                queued.add(arc)
+
+        while len(queue) != 0:
+            u, v = queue.popleft()
+            queued.discard((u, v))
             if self.revise(u, v):
                 if len(self.domains[u]) == 0:
                     return False
-                for m, n in self.crossword.overlaps.keys():
-                    if m == u and n != v:
-                        arcs.append((n, m))
+                for n in self.neighbors[u]:
+                    if n != v and (n, u) not in queued:
+                        queue.append((n, u))
+                        queued.add((n, u))
 
         return True
 
@@ -199,15 +222,38 @@ class CrosswordCreator():
         The first value in the list, for example, should be the one
         that rules out the fewest values among the neighbors of `var`.
         """
-        sorted(
-            self.domains[var],
-            key=lambda s: sum([
-                1
-                for k in self.crossword.overlaps.keys()
-                if k != None and var == k[0] and k[1] not in assignment and s in self.domains[k[1]]
-            ])
+        return sorted(self.domains[var], key=self.constraining_count(var, assignment))
+
+    def constraining_count(self, var, assignment):
+        """
+        Return a function giving, for a word in the domain of `var`, the
+        number of values it rules out for unassigned neighbors of `var`.
+        """
+        # For each unassigned neighbor: where it overlaps `var`, its domain
+        # size, and how many of its words have each letter at the overlap
+        constraints = []
+        for n in self.neighbors[var]:
+            if n in assignment:
+                continue
+            dx, dy = self.crossword.overlaps[var, n]
+            constraints.append((dx, len(self.domains[n]), self.letter_counts(n, dy)))
+
+        # A word rules out every neighbor value with another letter there
+        return lambda s: sum(
+            size - counts.get(s[dx], 0)
+            for dx, size, counts in constraints
+        )
+
+    def letter_counts(self, var, position):
+        """
+        Return a dictionary mapping each letter to the number of words in
+        the domain of `var` with that letter at `position`.
+        """
+        return Counter(
+            word[position]
+            for word in self.domains[var]
+            if len(word) > position
         )
-        return list(self.domains[var])
 
     def select_unassigned_variable(self, assignment: dict):
         """
@@ -217,19 +263,10 @@ class CrosswordCreator():
         degree. If there is a tie, any of the tied variables are acceptable
         return values.
         """
-        # sort is stable
-        return sorted(
-            sorted(
-                self.crossword.variables.difference(assignment.keys()),
-                key=lambda var: len(self.domains[var])
-            ),
-            key=lambda var: sum([
-                1
-                for k in self.crossword.overlaps.keys()
-                if k != None and k[0] == var
-            ]),
-            reverse=True
-        )[0]
+        return min(
+            self.crossword.variables.difference(assignment.keys()),
+            key=lambda var: (len(self.domains[var]), -len(self.neighbors[var]))
+        )
 
     def backtrack(self, assignment: dict):
         """
@@ -0,0 +1,120 @@
+import sys
+
+from crossword import *
+from generate import CrosswordCreator
+from wordindex import WordIndex
+
+
+class IndexedCrosswordCreator(CrosswordCreator):
+
+    def __init__(self, crossword):
+        """
+        Create new CSP crossword generator whose domains are bitsets
+        over a letter-position index of the vocabulary.
+
+        Each domain starts as the words of the variable's length, so
+        the unary constraints already hold.
+        """
+        self.crossword: Crossword = crossword
+        self.index = WordIndex(self.crossword.words)
+        self.domains = {
+            var: self.index.word_set(var.length)
+            for var in self.crossword.variables
+        }
+        self.neighbors = self.neighbor_map()
+        self.count_cache = dict()
+
+    def enforce_node_consistency(self):
+        """
+        Update `self.domains` such that each variable is node-consistent.
+        """
+        for var in self.domains:
+            self.domains[var] = self.index.word_set(
+                var.length, self.domains[var].bits & self.index.all.get(var.length, 0)
+            )
+
+    def letter_counts(self, var, position):
+        """
+        Return a dictionary mapping each letter to the number of words in
+        the domain of `var` with that letter at `position`.
+
+        Counts are cached per domain bitset, so they are only recomputed
+        for domains that changed since the last lookup (and are found
+        again when backtracking restores an earlier domain).
+        """
+        bits = self.domains[var].bits
+        key = (var.length, position, bits)
+        counts = self.count_cache.get(key)
+        if counts is None:
+            if len(self.count_cache) >= 4096:
+                self.count_cache.clear()
+            counts = {
+                letter: (members & bits).bit_count()
+                for letter, members in self.index.letters.get((var.length, position), {}).items()
+            }
+            self.count_cache[key] = counts
+        return counts
+
+    def supported(self, x, y):
+        """
+        Return the bitset of words for `x` that agree with at least one
+        word left in the domain of `y` where the two overlap.
+        """
+        dx, dy = self.crossword.overlaps[x, y]
+        bits = 0
+        for letter in self.index.letters_at(y.length, self.domains[y].bits, dy):
+            bits |= self.index.with_letter(x.length, dx, letter)
+        return bits
+
+    def compatible(self, x, word, y):
+        """
+        Return the bitset of words in the domain of `y` that agree with
+        assigning `word` to `x`.
+        """
+        dx, dy = self.crossword.overlaps[x, y]
+        return self.domains[y].bits & self.index.with_letter(y.length, dy, word[dx])
+
+    def revise(self, x: Variable, y: Variable):
+        """
+        Make variable `x` arc consistent with variable `y`.
+
+        Return True if a revision was made to the domain of `x`; return
+        False if no revision was made.
+        """
+        if self.crossword.overlaps[x, y] == None:
+            return False
+
+        bits = self.domains[x].bits & self.supported(x, y)
+        revised = bits != self.domains[x].bits
+        if revised:
+            self.domains[x] = self.index.word_set(x.length, bits)
+        return revised
+
+
+def main():
+
+    # Check usage
+    if len(sys.argv) not in [3, 4]:
+        sys.exit("Usage: python indexed.py structure words [output]")
+
+    # Parse command-line arguments
+    structure = sys.argv[1]
+    words = sys.argv[2]
+    output = sys.argv[3] if len(sys.argv) == 4 else None
+
+    # Generate crossword
+    crossword = Crossword(structure, words)
+    creator = IndexedCrosswordCreator(crossword)
+    assignment = creator.solve()
+
+    # Print result
+    if assignment is None:
+        print("No solution.")
+    else:
+        creator.print(assignment)
+        if output:
+            creator.save(assignment, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import sys
+import time
+
+from crossword import *
+from indexed import IndexedCrosswordCreator
+
+
+class MACCrosswordCreator(IndexedCrosswordCreator):
+
+    def __init__(self, crossword, propagation="mac"):
+        """
+        Create new CSP crossword generator that propagates constraints
+        after every assignment.
+
+        `propagation` is "forward" for forward checking only, or "mac"
+        to also maintain arc consistency over the arcs it touches.
+        Domain changes are pushed on `self.trail` as `(var, old domain)`
+        pairs and undone on backtrack, so domains are never copied.
+        """
+        super().__init__(crossword)
+        self.propagation = propagation
+        self.trail = []
+        self.stats = {"nodes": 0, "backtracks": 0, "propagation_time": 0.0}
+
+        # Variables of each length, which must hold distinct words
+        self.same_length = dict()
+        for var in self.crossword.variables:
+            self.same_length.setdefault(var.length, []).append(var)
+
+    def restrict(self, var, bits):
+        """
+        Shrink the domain of `var` to the words in bitset `bits`,
+        recording the old domain on the trail.
+        """
+        self.trail.append((var, self.domains[var]))
+        self.domains[var] = self.index.word_set(var.length, bits)
+
+    def undo(self, mark):
+        """
+        Restore every domain changed since the trail had length `mark`.
+        """
+        while len(self.trail) > mark:
+            var, domain = self.trail.pop()
+            self.domains[var] = domain
+
+    def revise(self, x: Variable, y: Variable):
+        """
+        Make variable `x` arc consistent with variable `y`, recording the
+        change on the trail.
+
+        Return True if a revision was made to the domain of `x`; return
+        False if no revision was made.
+        """
+        if self.crossword.overlaps[x, y] == None:
+            return False
+
+        bits = self.domains[x].bits & self.supported(x, y)
+        revised = bits != self.domains[x].bits
+        if revised:
+            self.restrict(x, bits)
+        return revised
+
+    def propagate(self, var, word, assignment):
+        """
+        Assign `word` to `var` in the domains and propagate.
+
+        Return False if some domain becomes empty.
+        """
+        self.restrict(var, self.domains[var].bits & self.index.with_word(var.length, word))
+
+        # No other variable may use the same word
+        word_bit = self.index.with_word(var.length, word)
+        for other in self.same_length[var.length]:
+            if other != var and other not in assignment and self.domains[other].bits & word_bit:
+                self.restrict(other, self.domains[other].bits & ~word_bit)
+                if len(self.domains[other]) == 0:
+                    return False
+
+        # Forward checking: neighbors must agree with the new word
+        for n in self.neighbors[var]:
+            if n in assignment:
+                continue
+            bits = self.compatible(var, word, n)
+            if bits != self.domains[n].bits:
+                self.restrict(n, bits)
+                if bits == 0:
+                    return False
+
+        if self.propagation == "mac":
+            return self.ac3([
+                (m, n)
+                for n in self.neighbors[var] if n not in assignment
+                for m in self.neighbors[n] if m not in assignment and m != var
+            ])
+        return True
+
+    def solve(self):
+        """
+        Enforce node and arc consistency, and then solve the CSP.
+        """
+        self.enforce_node_consistency()
+        if not self.ac3():
+            return None
+        self.trail = []
+        return self.backtrack(dict())
+
+    def backtrack(self, assignment: dict):
+        """
+        Using Backtracking Search with constraint propagation, take as
+        input a partial assignment for the crossword and return a
+        complete assignment if possible to do so.
+
+        If no assignment is possible, return None.
+        """
+        return next(self.search(assignment), None)
+
+    def solutions(self, limit=None, seconds=None):
+        """
+        Generate distinct complete assignments one at a time, stopping
+        after `limit` solutions or `seconds` seconds if given.
+
+        The search resumes from where the last solution was found, so
+        taking only the first few solutions costs no more than finding
+        them.
+        """
+        if limit is not None and limit <= 0:
+            return
+        deadline = time.perf_counter() + seconds if seconds is not None else None
+        self.enforce_node_consistency()
+        if not self.ac3():
+            return
+        self.trail = []
+
+        found = 0
+        for assignment in self.search(dict(), deadline):
+            yield assignment
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+    def search(self, assignment, deadline=None):
+        """
+        Generate every complete assignment extending `assignment`,
+        giving up once `deadline` (a `time.perf_counter` value) passes.
+        """
+        if self.assignment_complete(assignment):
+            yield dict(assignment)
+            return
+
+        var = self.select_unassigned_variable(assignment)
+        for word in self.order_domain_values(var, assignment):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            self.stats["nodes"] += 1
+            mark = len(self.trail)
+            assignment[var] = word
+
+            start = time.perf_counter()
+            ok = self.propagate(var, word, assignment)
+            self.stats["propagation_time"] += time.perf_counter() - start
+
+            if ok:
+                yield from self.search(assignment, deadline)
+
+            del assignment[var]
+            self.undo(mark)
+            self.stats["backtracks"] += 1
+
+
+def main():
+
+    # Check usage
+    if len(sys.argv) not in [3, 4]:
+        sys.exit("Usage: python mac.py structure words [output]")
+
+    # Parse command-line arguments
+    structure = sys.argv[1]
+    words = sys.argv[2]
+    output = sys.argv[3] if len(sys.argv) == 4 else None
+
+    # Generate crossword
+    crossword = Crossword(structure, words)
+    creator = MACCrosswordCreator(crossword)
+    assignment = creator.solve()
+
+    # Print result
+    if assignment is None:
+        print("No solution.")
+    else:
+        creator.print(assignment)
+        if output:
+            creator.save(assignment, output)
+
+    stats = creator.stats
+    print(f"Nodes: {stats['nodes']}")
+    print(f"Backtracks: {stats['backtracks']}")
+    print(f"Propagation time: {stats['propagation_time']:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
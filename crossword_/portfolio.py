@@ -0,0 +1,131 @@
+import argparse
+import multiprocessing
+import random
+
+from crossword import *
+from mac import MACCrosswordCreator
+
+# Solver configurations tried in order: (propagation, value ordering)
+CONFIGURATIONS = [
+    ("mac", "lcv"),
+    ("forward", "lcv"),
+    ("mac", "random"),
+    ("forward", "random"),
+]
+
+
+class RandomizedCrosswordCreator(MACCrosswordCreator):
+
+    def __init__(self, crossword, propagation="mac", ordering="lcv", seed=None):
+        """
+        Create new CSP crossword generator that breaks heuristic ties at
+        random.
+
+        `ordering` is "lcv" for least-constraining-value ordering with
+        random tie-breaking, or "random" to shuffle each domain.
+        """
+        super().__init__(crossword, propagation)
+        self.ordering = ordering
+        self.random = random.Random(seed)
+
+    def select_unassigned_variable(self, assignment: dict):
+        """
+        Return the unassigned variable with the fewest remaining values,
+        then the highest degree, then chosen at random.
+        """
+        return min(
+            self.crossword.variables.difference(assignment.keys()),
+            key=lambda var: (
+                len(self.domains[var]), -len(self.neighbors[var]), self.random.random()
+            )
+        )
+
+    def order_domain_values(self, var, assignment):
+        """
+        Return the values in the domain of `var`, either by least
+        constraining value with ties shuffled, or fully shuffled.
+        """
+        values = list(self.domains[var])
+        self.random.shuffle(values)
+        if self.ordering == "random":
+            return values
+
+        # sort is stable, so shuffled order breaks ties
+        return sorted(values, key=self.constraining_count(var, assignment))
+
+
+def _solve(args):
+    """
+    Solve `crossword` with one configuration and return
+    `(assignment, configuration)`.
+    """
+    crossword, propagation, ordering, seed = args
+    creator = RandomizedCrosswordCreator(crossword, propagation, ordering, seed)
+    return creator.solve(), (propagation, ordering, seed)
+
+
+def portfolio(crossword, workers=None, seed=None):
+    """
+    Solve `crossword` with several solver configurations at once in a
+    process pool and return `(assignment, configuration)` for the first
+    one to finish with a solution, or `(None, None)` if none has one.
+
+    Remaining solvers are stopped as soon as a solution arrives.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    rng = random.Random(seed)
+    jobs = [
+        (crossword, *CONFIGURATIONS[k % len(CONFIGURATIONS)], rng.randrange(2 ** 32))
+        for k in range(workers)
+    ]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for assignment, configuration in pool.imap_unordered(_solve, jobs):
+            if assignment is not None:
+                return assignment, configuration
+        return None, None
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate crosswords with a portfolio of solvers."
+    )
+    parser.add_argument("structure")
+    parser.add_argument("words")
+    parser.add_argument("output", nargs="?", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--solutions", type=int, default=None,
+                        help="stream up to this many solutions with one solver")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="time budget when streaming solutions")
+    args = parser.parse_args()
+
+    crossword = Crossword(args.structure, args.words)
+    creator = MACCrosswordCreator(crossword)
+
+    if args.solutions is not None or args.seconds is not None:
+        for k, assignment in enumerate(
+            creator.solutions(limit=args.solutions, seconds=args.seconds)
+        ):
+            if k:
+                print()
+            creator.print(assignment)
+        return
+
+    assignment, configuration = portfolio(crossword, args.workers, args.seed)
+    if assignment is None:
+        print("No solution.")
+    else:
+        print(f"Solved by {configuration}")
+        creator.print(assignment)
+        if args.output:
+            creator.save(assignment, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import multiprocessing
+
+import numpy as np
+
+FONT = "assets/fonts/OpenSans-Regular.ttf"
+
+
+class Renderer():
+
+    def __init__(self, crossword, font=FONT, cell_size=100, cell_border=2):
+        """
+        Create a renderer for assignments of `crossword` whose images
+        match those of `CrosswordCreator.save` up to anti-aliasing of
+        the letters.
+
+        The font is loaded once, each letter is drawn once into a cached
+        cell-sized tile, and the grid background is built once from the
+        structure with array operations.
+        """
+        from PIL import Image, ImageFont
+
+        self.crossword = crossword
+        self.cell_size = cell_size
+        self.cell_border = cell_border
+        self.font = ImageFont.truetype(font, 80)
+        self.glyphs = dict()
+
+        # Rectangles in `save` include both corners
+        self.tile_size = cell_size - 2 * cell_border + 1
+
+        # White interiors for open cells, black everywhere else
+        structure = np.array(self.crossword.structure, dtype=bool)
+        interior = np.zeros((cell_size, cell_size), dtype=bool)
+        interior[cell_border:cell_border + self.tile_size,
+                 cell_border:cell_border + self.tile_size] = True
+        white = np.kron(structure, interior)
+
+        pixels = np.zeros(white.shape + (4,), dtype=np.uint8)
+        pixels[..., 3] = 255
+        pixels[white, :3] = 255
+        self.background = Image.fromarray(pixels, "RGBA")
+
+    def glyph(self, letter):
+        """
+        Return the cached tile for `letter`: a white cell interior with
+        the letter drawn where `save` would draw it.
+        """
+        if letter not in self.glyphs:
+            from PIL import Image, ImageDraw
+
+            interior_size = self.cell_size - 2 * self.cell_border
+            tile = Image.new("RGBA", (self.tile_size, self.tile_size), "white")
+            draw = ImageDraw.Draw(tile)
+            _, _, w, h = draw.textbbox((0, 0), letter, font=self.font)
+            draw.text(
+                ((interior_size - w) / 2, (interior_size - h) / 2 - 10),
+                letter, fill="black", font=self.font
+            )
+            self.glyphs[letter] = tile
+        return self.glyphs[letter]
+
+    def render(self, assignment):
+        """
+        Return an image of `assignment`.
+        """
+        img = self.background.copy()
+        for variable, word in assignment.items():
+            for k, letter in enumerate(word):
+                i, j = variable.cells[k]
+                img.paste(self.glyph(letter), (
+                    j * self.cell_size + self.cell_border,
+                    i * self.cell_size + self.cell_border,
+                ))
+        return img
+
+    def save(self, assignment, filename):
+        """
+        Save an image of `assignment` to `filename`.
+        """
+        self.render(assignment).save(filename)
+
+
+# Renderer of each worker process, built once by `init_worker`
+renderer = None
+
+
+def init_worker(crossword, font):
+    global renderer
+    renderer = Renderer(crossword, font)
+
+
+def _save(args):
+    assignment, filename = args
+    renderer.save(assignment, filename)
+    return filename
+
+
+def save_many(crossword, assignments, filenames, workers=None, font=FONT):
+    """
+    Save each assignment in `assignments` to the matching file in
+    `filenames`, spread across `workers` processes that each keep their
+    own renderer and glyph cache.
+    """
+    with multiprocessing.Pool(
+        workers, initializer=init_worker, initargs=(crossword, font)
+    ) as pool:
+        return list(pool.imap(_save, zip(assignments, filenames), chunksize=8))
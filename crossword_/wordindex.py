@@ -0,0 +1,124 @@
+class WordIndex():
+    """
+    Index of a vocabulary by word length and letter position.
+
+    Words of each length get their own dense IDs, so sets of same-length
+    words are stored as bitsets (Python ints) with bit `k` standing for
+    the word with ID `k`.
+    """
+
+    def __init__(self, words):
+        self.words = dict()
+        self.ids = dict()
+        for word in sorted(words):
+            self.words.setdefault(len(word), []).append(word)
+        for length, words in self.words.items():
+            self.ids[length] = {word: k for k, word in enumerate(words)}
+
+        # Bitset of all words of each length
+        self.all = {
+            length: (1 << len(words)) - 1
+            for length, words in self.words.items()
+        }
+
+        # Bitsets of the words with each letter at `position`, per length
+        self.letters = dict()
+        for length, words in self.words.items():
+            members = dict()
+            for k, word in enumerate(words):
+                for position, letter in enumerate(word):
+                    members.setdefault((position, letter), []).append(k)
+            for (position, letter), ids in members.items():
+                self.letters.setdefault((length, position), {})[letter] = to_bits(ids, len(words))
+
+    def word_set(self, length, bits=None):
+        """
+        Return a `WordSet` of words of `length`, holding every such word
+        if `bits` is None.
+        """
+        if bits is None:
+            bits = self.all.get(length, 0)
+        return WordSet(self, length, bits)
+
+    def with_letter(self, length, position, letter):
+        """
+        Return the bitset of words of `length` with `letter` at `position`.
+        """
+        return self.letters.get((length, position), {}).get(letter, 0)
+
+    def with_word(self, length, word):
+        """
+        Return the bitset holding just `word`, or 0 if it is not a word
+        of `length`.
+        """
+        k = self.ids.get(length, {}).get(word)
+        return 0 if k is None else 1 << k
+
+    def letters_at(self, length, bits, position):
+        """
+        Return the set of letters found at `position` among the words of
+        `length` in bitset `bits`.
+        """
+        return {
+            letter
+            for letter, members in self.letters.get((length, position), {}).items()
+            if members & bits
+        }
+
+
+def to_bits(ids, size):
+    """
+    Return a bitset (int) with bits `ids` set, out of `size` bits.
+    """
+    array = bytearray((size + 7) // 8)
+    for k in ids:
+        array[k >> 3] |= 1 << (k & 7)
+    return int.from_bytes(array, "little")
+
+
+def from_bits(bits):
+    """
+    Generate the positions of the set bits in `bits`, in increasing order.
+    """
+    array = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for i, byte in enumerate(array):
+        while byte:
+            low = byte & -byte
+            yield (i << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class WordSet():
+    """
+    Set of same-length words stored as a bitset over a `WordIndex`.
+
+    Supports `len`, iteration and membership tests like the sets of
+    strings used by `CrosswordCreator`.
+    """
+
+    __slots__ = ("index", "length", "bits")
+
+    def __init__(self, index, length, bits):
+        self.index = index
+        self.length = length
+        self.bits = bits
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __iter__(self):
+        words = self.index.words.get(self.length, [])
+        for k in from_bits(self.bits):
+            yield words[k]
+
+    def __contains__(self, word):
+        k = self.index.ids.get(self.length, {}).get(word)
+        return k is not None and (self.bits >> k) & 1 == 1
+
+    def __eq__(self, other):
+        if isinstance(other, WordSet):
+            return self.length == other.length and self.bits == other.bits
+        return set(self) == other
+
+    def __repr__(self):
+        return f"WordSet({set(self)!r})"
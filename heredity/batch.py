@@ -0,0 +1,134 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from heredity import PROBS, load_data
+from elimination import eliminate, factor_tables
+
+# Factor tables of each worker process, built once by `init_worker`
+tables = None
+
+
+def family_files(source):
+    """
+    Return the family CSV files named by `source`: every `.csv` file in
+    it if it is a directory, otherwise one path per non-empty line of
+    the manifest file (relative paths are relative to the manifest).
+    """
+    if os.path.isdir(source):
+        return sorted(
+            os.path.join(source, filename)
+            for filename in os.listdir(source)
+            if filename.endswith(".csv")
+        )
+
+    base = os.path.dirname(source)
+    with open(source) as f:
+        return [
+            os.path.join(base, line.strip())
+            for line in f
+            if line.strip()
+        ]
+
+
+def init_worker(probs):
+    """
+    Build the factor tables once per worker process.
+    """
+    global tables
+    tables = factor_tables(probs)
+
+
+def process(filename):
+    """
+    Load one family and return `(filename, probabilities, error)`.
+    """
+    try:
+        people = load_data(filename)
+        return filename, eliminate(people, tables=tables), None
+    except Exception as e:
+        return filename, None, f"{type(e).__name__}: {e}"
+
+
+def write_jsonl(results, out):
+    """
+    Write one JSON object per family to `out`.
+    """
+    for filename, probabilities, error in results:
+        record = {"file": filename}
+        if error is None:
+            record["probabilities"] = {
+                person: {
+                    "gene": {str(k): v for k, v in dist["gene"].items()},
+                    "trait": {str(k).lower(): v for k, v in dist["trait"].items()},
+                }
+                for person, dist in probabilities.items()
+            }
+        else:
+            record["error"] = error
+        out.write(json.dumps(record) + "\n")
+
+
+def write_csv(results, out):
+    """
+    Write one CSV row per person to `out`, with an `error` column for
+    families that could not be processed.
+    """
+    writer = csv.writer(out)
+    writer.writerow([
+        "file", "name", "gene_2", "gene_1", "gene_0", "trait_true", "trait_false", "error"
+    ])
+    for filename, probabilities, error in results:
+        if error is not None:
+            writer.writerow([filename, "", "", "", "", "", "", error])
+            continue
+        for person, dist in probabilities.items():
+            writer.writerow([
+                filename, person,
+                dist["gene"][2], dist["gene"][1], dist["gene"][0],
+                dist["trait"][True], dist["trait"][False], "",
+            ])
+
+
+def run(files, out, output_format="jsonl", workers=None, probs=PROBS, chunksize=16):
+    """
+    Compute probabilities for every family in `files` across a process
+    pool and stream the results, in input order, to the file object `out`.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(probs,)
+    ) as executor:
+        results = executor.map(process, files, chunksize=chunksize)
+        if output_format == "csv":
+            write_csv(results, out)
+        else:
+            write_jsonl(results, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute gene and trait probabilities for many families."
+    )
+    parser.add_argument("source", help="directory of CSV files, or a manifest listing them")
+    parser.add_argument("-o", "--output", default=None, help="output file (default stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "csv" if args.output and args.output.endswith(".csv") else "jsonl"
+
+    files = family_files(args.source)
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            run(files, out, output_format, args.workers)
+    else:
+        run(files, sys.stdout, output_format, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import heapq
+import itertools
+
+import numpy as np
+
+from heredity import PROBS
+
+
+def inheritance_table(probs=PROBS):
+    """
+    Return an array `table[child, mother, father]` with the probability
+    that a child has `child` copies of the gene given the number of
+    copies each parent has.
+    """
+    m = probs["mutation"]
+    passes = np.array([m, 0.5, 1 - m])
+    keeps = 1 - passes
+
+    table = np.empty((3, 3, 3))
+    table[0] = np.outer(keeps, keeps)
+    table[1] = np.outer(passes, keeps) + np.outer(keeps, passes)
+    table[2] = np.outer(passes, passes)
+    return table
+
+
+def trait_table(probs=PROBS):
+    """
+    Return an array `table[gene, trait]` with the probability of showing
+    the trait (index 1) or not (index 0) given a number of gene copies.
+    """
+    return np.array([
+        [probs["trait"][gene][False], probs["trait"][gene][True]]
+        for gene in range(3)
+    ])
+
+
+def gene_table(probs=PROBS):
+    """
+    Return the unconditional distribution over gene copies as an array.
+    """
+    return np.array([probs["gene"][gene] for gene in range(3)])
+
+
+def factor_tables(probs=PROBS):
+    """
+    Return the prior, inheritance and trait tables for `probs` as a
+    dictionary, so they can be built once and shared across families.
+    """
+    return {
+        "prior": gene_table(probs),
+        "inheritance": inheritance_table(probs),
+        "traits": trait_table(probs),
+    }
+
+
+def person_factors(people, probs=PROBS, tables=None):
+    """
+    Return the factors of the pedigree as a list of `(scope, table)`
+    pairs, where `scope` is a tuple of names and `table` has one axis
+    of length 3 (gene copies) per name.
+
+    Every person gets a prior or inheritance factor, and every person
+    with a known trait gets an evidence factor. `tables` may hold
+    precomputed `factor_tables(probs)`.
+    """
+    if tables is None:
+        tables = factor_tables(probs)
+    inheritance = tables["inheritance"]
+    traits = tables["traits"]
+    prior = tables["prior"]
+
+    factors = []
+    for name, person in people.items():
+        if person["mother"] is None and person["father"] is None:
+            factors.append(((name,), prior))
+        elif person["mother"] is not None and person["father"] is not None:
+            factors.append(((name, person["mother"], person["father"]), inheritance))
+        else:
+            raise ValueError(f"invalid data: {name} has only one parent")
+
+        if person["trait"] is not None:
+            factors.append(((name,), traits[:, int(person["trait"])]))
+    return factors
+
+
+def multiply_sum(factors, keep, normalize=False):
+    """
+    Multiply `factors` together and sum out every variable not in `keep`.
+    Return the result as a `(scope, table)` pair with scope `keep`.
+
+    If `normalize` is True, scale the table to sum to 1; messages are
+    only known up to a constant, and this keeps long pedigrees from
+    underflowing.
+    """
+    keep = tuple(keep)
+    labels = {}
+    operands = []
+    for scope, table in factors:
+        operands += [table, [labels.setdefault(v, len(labels)) for v in scope]]
+
+    # Variables to keep that no factor mentions are uniform
+    for v in keep:
+        if v not in labels:
+            operands += [np.ones(3), [labels.setdefault(v, len(labels))]]
+
+    table = np.einsum(*operands, [labels[v] for v in keep])
+    if normalize:
+        table = table / table.sum()
+    return keep, table
+
+
+def elimination_order(variables, scopes):
+    """
+    Return an elimination order for `variables` chosen greedily by
+    fewest fill-in edges, breaking ties by fewest neighbors.
+
+    For pedigrees without loops this never adds fill-in edges, so every
+    cluster has at most a person and their two parents.
+    """
+    neighbors = {v: set() for v in variables}
+    for scope in scopes:
+        for a in scope:
+            neighbors[a].update(b for b in scope if b != a)
+
+    def score(v):
+        fill = sum(
+            1 for a, b in itertools.combinations(neighbors[v], 2)
+            if b not in neighbors[a]
+        )
+        return (fill, len(neighbors[v]))
+
+    heap = [(*score(v), v) for v in variables]
+    heapq.heapify(heap)
+    order = []
+    eliminated = set()
+
+    while heap:
+        fill, degree, v = heapq.heappop(heap)
+        if v in eliminated:
+            continue
+
+        # Scores go stale as the graph changes; requeue with the current one
+        current = score(v)
+        if (fill, degree) != current:
+            heapq.heappush(heap, (*current, v))
+            continue
+
+        order.append(v)
+        eliminated.add(v)
+        for a, b in itertools.combinations(neighbors[v], 2):
+            neighbors[a].add(b)
+            neighbors[b].add(a)
+        for a in neighbors[v]:
+            neighbors[a].discard(v)
+        for a in neighbors[v]:
+            heapq.heappush(heap, (*score(a), a))
+        del neighbors[v]
+
+    return order
+
+
+def gene_marginals(people, probs=PROBS, tables=None):
+    """
+    Return a dictionary mapping each person to an array with the
+    probability of having 0, 1 or 2 copies of the gene, given all
+    known traits.
+
+    Variable elimination builds a cluster tree (one cluster per
+    eliminated variable); a second pass sends messages back down the
+    tree, so all marginals cost about as much as two eliminations.
+    """
+    factors = person_factors(people, probs, tables)
+    order = elimination_order(list(people), [scope for scope, _ in factors])
+    position = {v: k for k, v in enumerate(order)}
+
+    # Each factor belongs to the first variable in its scope to be eliminated
+    potentials = {v: [] for v in order}
+    for scope, table in factors:
+        potentials[min(scope, key=position.get)].append((scope, table))
+
+    # Upward pass: eliminate variables in order
+    scopes = {}
+    incoming = {v: [] for v in order}
+    for v in order:
+        local = potentials[v] + [message for _, message in incoming[v]]
+        scope = []
+        for s, _ in local:
+            scope += [u for u in s if u not in scope]
+        if v not in scope:
+            scope.append(v)
+        scopes[v] = scope
+
+        separator = [u for u in scope if u != v]
+        if separator:
+            parent = min(separator, key=position.get)
+            incoming[parent].append((v, multiply_sum(local, separator, normalize=True)))
+
+    # Downward pass: send messages back from the roots
+    downward = {}
+    for v in reversed(order):
+        for child, _ in incoming[v]:
+            local = potentials[v] + [
+                message for other, message in incoming[v] if other != child
+            ]
+            if v in downward:
+                local.append(downward[v])
+            separator = [u for u in scopes[child] if u != child]
+            downward[child] = multiply_sum(local, separator, normalize=True)
+
+    marginals = {}
+    for v in order:
+        local = potentials[v] + [message for _, message in incoming[v]]
+        if v in downward:
+            local.append(downward[v])
+        _, marginals[v] = multiply_sum(local, [v], normalize=True)
+    return marginals
+
+
+def eliminate(people, probs=PROBS, tables=None):
+    """
+    Compute each person's gene and trait distributions by variable
+    elimination and return them in the same structure as `main`.
+    """
+    if tables is None:
+        tables = factor_tables(probs)
+    traits = tables["traits"]
+    marginals = gene_marginals(people, probs, tables)
+
+    probabilities = dict()
+    for person in people:
+        gene = marginals[person]
+        trait = people[person]["trait"]
+        if trait is None:
+            p_trait = float(gene @ traits[:, 1])
+        else:
+            p_trait = 1.0 if trait else 0.0
+        probabilities[person] = {
+            "gene": {2: float(gene[2]), 1: float(gene[1]), 0: float(gene[0])},
+            "trait": {True: p_trait, False: 1 - p_trait},
+        }
+    return probabilities
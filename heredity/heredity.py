@@ -22,9 +22,47 @@ PROBS = {
 def main():
 
     # Check for proper usage
-    if len(sys.argv) != 2:
-        sys.exit("Usage: python heredity.py data.csv")
+    if len(sys.argv) not in [2, 3]:
+        sys.exit("Usage: python heredity.py data.csv [method]")
     people = load_data(sys.argv[1])
+    method = sys.argv[2] if len(sys.argv) == 3 else "enumerate"
+
+    # Compute gene and trait probabilities for each person
+    if method == "enumerate":
+        probabilities = enumerate_probabilities(people)
+    elif method == "eliminate":
+        from elimination import eliminate
+        probabilities = eliminate(people)
+    elif method == "prune":
+        from pruned import pruned_probabilities
+        probabilities = pruned_probabilities(people)
+    elif method == "vectorize":
+        from vectorized import vectorized_probabilities
+        probabilities = vectorized_probabilities(people)
+    elif method == "gibbs":
+        from sampling import gibbs
+        probabilities, _ = gibbs(people)
+    elif method == "weighting":
+        from sampling import likelihood_weighting
+        probabilities, _ = likelihood_weighting(people)
+    else:
+        sys.exit(f"Unknown method: {method}")
+
+    # Print results
+    for person in people:
+        print(f"{person}:")
+        for field in probabilities[person]:
+            print(f"  {field.capitalize()}:")
+            for value in probabilities[person][field]:
+                p = probabilities[person][field][value]
+                print(f"    {value}: {p:.4f}")
+
+
+def enumerate_probabilities(people):
+    """
+    Compute each person's gene and trait distributions by enumerating
+    every assignment of genes and traits consistent with the evidence.
+    """
 
     # Keep track of gene and trait probabilities for each person
     probabilities = {
@@ -57,15 +95,7 @@ def main():
 
     # Ensure probabilities sum to 1
     normalize(probabilities)
-
-    # Print results
-    for person in people:
-        print(f"{person}:")
-        for field in probabilities[person]:
-            print(f"  {field.capitalize()}:")
-            for value in probabilities[person][field]:
-                p = probabilities[person][field][value]
-                print(f"    {value}: {p:.4f}")
+    return probabilities
 
 
 def load_data(filename):
@@ -0,0 +1,104 @@
+from heredity import PROBS, normalize
+from elimination import gene_table, inheritance_table, trait_table
+
+
+def topological_order(people):
+    """
+    Return the names in `people` ordered so that both parents of every
+    person come before them.
+    """
+    children = {name: [] for name in people}
+    waiting = dict()
+    ready = []
+    for name, person in people.items():
+        parents = {person["mother"], person["father"]} - {None}
+        waiting[name] = len(parents)
+        for parent in parents:
+            children[parent].append(name)
+        if not parents:
+            ready.append(name)
+
+    order = []
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for child in children[name]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                ready.append(child)
+
+    if len(order) != len(people):
+        raise ValueError("invalid data: family tree has a cycle")
+    return order
+
+
+def assignments(people, probs=PROBS):
+    """
+    Generate every gene assignment with nonzero probability given the
+    known traits, as `(genes, p)` pairs where `genes` maps each name to
+    a number of gene copies and `p` is the joint probability of those
+    genes and the known traits.
+
+    People are assigned in topological order and each step multiplies
+    in one precomputed factor, so a partial assignment is dropped as
+    soon as its probability reaches 0. `genes` is reused between
+    assignments; copy it to keep it.
+    """
+    order = topological_order(people)
+    prior = gene_table(probs).tolist()
+    inheritance = inheritance_table(probs).tolist()
+    traits = trait_table(probs).tolist()
+    genes = dict()
+
+    def extend(k, p):
+        if k == len(order):
+            yield genes, p
+            return
+
+        name = order[k]
+        mother = people[name]["mother"]
+        father = people[name]["father"]
+        trait = people[name]["trait"]
+        for gene in range(3):
+            if mother is None:
+                q = p * prior[gene]
+            else:
+                q = p * inheritance[gene][genes[mother]][genes[father]]
+            if trait is not None:
+                q *= traits[gene][trait]
+            if q == 0:
+                continue
+
+            genes[name] = gene
+            yield from extend(k + 1, q)
+        genes.pop(name, None)
+
+    yield from extend(0, 1.0)
+
+
+def pruned_probabilities(people, probs=PROBS):
+    """
+    Compute each person's gene and trait distributions by streaming
+    assignments from `assignments`.
+
+    Unknown traits are summed out with the trait table instead of being
+    enumerated, since a person's trait only depends on their own genes.
+    """
+    traits = trait_table(probs).tolist()
+    probabilities = {
+        person: {"gene": {2: 0, 1: 0, 0: 0}, "trait": {True: 0, False: 0}}
+        for person in people
+    }
+
+    for genes, p in assignments(people, probs):
+        for name, gene in genes.items():
+            probabilities[name]["gene"][gene] += p
+            trait = people[name]["trait"]
+            if trait is None:
+                probabilities[name]["trait"][True] += p * traits[gene][1]
+                probabilities[name]["trait"][False] += p * traits[gene][0]
+            else:
+                probabilities[name]["trait"][trait] += p
+
+    normalize(probabilities)
+    return probabilities
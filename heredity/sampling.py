@@ -0,0 +1,311 @@
+import argparse
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from heredity import PROBS, load_data
+from elimination import gene_table, inheritance_table, trait_table
+from pruned import topological_order
+
+
+class Pedigree():
+    """
+    Array form of a family: people are numbered in topological order,
+    and each person knows their parents, children and trait evidence.
+    """
+
+    def __init__(self, people, probs=PROBS):
+        self.names = topological_order(people)
+        index = {name: k for k, name in enumerate(self.names)}
+        self.size = len(self.names)
+
+        self.prior = gene_table(probs)
+        self.inheritance = inheritance_table(probs)
+        self.traits = trait_table(probs)
+
+        self.mother = [index.get(people[name]["mother"], -1) for name in self.names]
+        self.father = [index.get(people[name]["father"], -1) for name in self.names]
+        self.children = [[] for _ in self.names]
+        for k in range(self.size):
+            if self.mother[k] >= 0:
+                self.children[self.mother[k]].append(k)
+                if self.father[k] != self.mother[k]:
+                    self.children[self.father[k]].append(k)
+
+        # Likelihood of each gene count given the observed trait
+        self.evidence = np.ones((self.size, 3))
+        self.observed = np.full(self.size, -1)
+        for k, name in enumerate(self.names):
+            trait = people[name]["trait"]
+            if trait is not None:
+                self.evidence[k] = self.traits[:, int(trait)]
+                self.observed[k] = int(trait)
+
+    def probabilities(self, genes, has_trait):
+        """
+        Return the `main` structure from per-person arrays of gene
+        probabilities (shape (n, 3)) and trait probabilities (shape (n,)).
+        """
+        has_trait = np.where(self.observed >= 0, self.observed, has_trait)
+        return {
+            name: {
+                "gene": {2: float(genes[k, 2]), 1: float(genes[k, 1]), 0: float(genes[k, 0])},
+                "trait": {True: float(has_trait[k]), False: float(1 - has_trait[k])},
+            }
+            for k, name in enumerate(self.names)
+        }
+
+
+def categorical(rng, weights):
+    """
+    Draw one index per row of `weights` (shape (rows, 3)), with
+    probability proportional to the row's entries.
+    """
+    cumulative = np.cumsum(weights, axis=1)
+    u = rng.random(len(weights)) * cumulative[:, -1]
+    return (u[:, None] >= cumulative).sum(axis=1)
+
+
+def _weighting_worker(args):
+    """
+    Draw likelihood-weighted samples in blocks of `block` until
+    `samples` are drawn (if not None) or `seconds` have passed. Return the weighted
+    gene counts, weighted trait sums, weight sum, squared weight sum and
+    number of samples.
+    """
+    pedigree, samples, seconds, block, seed = args
+    rng = np.random.default_rng(seed)
+    deadline = time.perf_counter() + seconds if seconds else None
+
+    genes = np.zeros((pedigree.size, 3))
+    has_trait = np.zeros(pedigree.size)
+    weight_sum = weight_square = 0.0
+    drawn = 0
+    while samples is None or drawn < samples:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        size = block if samples is None else min(block, samples - drawn)
+        g = np.zeros((pedigree.size, size), dtype=np.int64)
+        w = np.ones(size)
+
+        # Sample genes forward, weighting by the observed traits
+        for k in range(pedigree.size):
+            if pedigree.mother[k] < 0:
+                dist = np.broadcast_to(pedigree.prior, (size, 3))
+            else:
+                dist = pedigree.inheritance[:, g[pedigree.mother[k]], g[pedigree.father[k]]].T
+            g[k] = categorical(rng, dist)
+            w *= pedigree.evidence[k, g[k]]
+
+        for copies in range(3):
+            genes[:, copies] += (g == copies) @ w
+        has_trait += pedigree.traits[g, 1] @ w
+        weight_sum += w.sum()
+        weight_square += (w ** 2).sum()
+        drawn += size
+
+    return genes, has_trait, weight_sum, weight_square, drawn
+
+
+def likelihood_weighting(people, samples=100000, seconds=None, workers=1,
+                         seed=None, block=4096, probs=PROBS):
+    """
+    Estimate each person's gene and trait distributions by likelihood
+    weighting, split across `workers` processes.
+
+    Sampling stops after `samples` samples, or after `seconds` seconds
+    if that comes first; either budget may be None, but not both. Return `(probabilities, diagnostics)`, where
+    diagnostics include the number of samples and the effective sample
+    size; a small effective sample size means the evidence is unlikely
+    under the prior and the estimate is unreliable.
+    """
+    if samples is None and seconds is None:
+        raise ValueError("need a sample budget or a time budget")
+    pedigree = Pedigree(people, probs)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    if samples is None:
+        shares = [None] * workers
+    else:
+        shares = [samples // workers + (1 if k < samples % workers else 0) for k in range(workers)]
+    jobs = [(pedigree, share, seconds, block, s) for share, s in zip(shares, seeds)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_weighting_worker, jobs))
+
+    genes = sum(r[0] for r in results)
+    has_trait = sum(r[1] for r in results)
+    weight_sum = sum(r[2] for r in results)
+    weight_square = sum(r[3] for r in results)
+    drawn = sum(r[4] for r in results)
+
+    diagnostics = {
+        "samples": drawn,
+        "effective_samples": float(weight_sum ** 2 / weight_square) if weight_square else 0.0,
+    }
+    return pedigree.probabilities(genes / weight_sum, has_trait / weight_sum), diagnostics
+
+
+def _gibbs_worker(args):
+    """
+    Run `chains` Gibbs chains side by side for `sweeps` sweeps (if not
+    None) or until `seconds` have passed, discarding the first `burn_in` sweeps.
+
+    Return the gene counts and trait sums over kept sweeps, the per-chain
+    sums and squared sums of each person's gene count, and the number of
+    kept sweeps.
+    """
+    pedigree, chains, sweeps, burn_in, seconds, seed = args
+    rng = np.random.default_rng(seed)
+    deadline = time.perf_counter() + seconds if seconds else None
+    copies = np.arange(3)
+
+    # Start each chain from a forward sample of the prior
+    g = np.zeros((pedigree.size, chains), dtype=np.int64)
+    for k in range(pedigree.size):
+        if pedigree.mother[k] < 0:
+            dist = np.broadcast_to(pedigree.prior, (chains, 3))
+        else:
+            dist = pedigree.inheritance[:, g[pedigree.mother[k]], g[pedigree.father[k]]].T
+        g[k] = categorical(rng, dist)
+
+    genes = np.zeros((pedigree.size, 3))
+    has_trait = np.zeros(pedigree.size)
+    chain_sum = np.zeros((pedigree.size, chains))
+    chain_square = np.zeros((pedigree.size, chains))
+    kept = 0
+
+    for sweep in itertools.count() if sweeps is None else range(sweeps):
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+        for k in range(pedigree.size):
+
+            # Probability of each gene count given everyone else
+            if pedigree.mother[k] < 0:
+                dist = np.tile(pedigree.prior, (chains, 1))
+            else:
+                dist = pedigree.inheritance[:, g[pedigree.mother[k]], g[pedigree.father[k]]].T.copy()
+            dist *= pedigree.evidence[k]
+            for c in pedigree.children[k]:
+                m = copies if pedigree.mother[c] == k else g[pedigree.mother[c]][:, None]
+                f = copies if pedigree.father[c] == k else g[pedigree.father[c]][:, None]
+                dist *= pedigree.inheritance[g[c][:, None], m, f]
+                dist /= dist.sum(axis=1, keepdims=True)
+            g[k] = categorical(rng, dist)
+
+        if sweep >= burn_in:
+            for n in range(3):
+                genes[:, n] += (g == n).sum(axis=1)
+            has_trait += pedigree.traits[g, 1].sum(axis=1)
+            chain_sum += g
+            chain_square += g ** 2
+            kept += 1
+
+    return genes, has_trait, chain_sum, chain_square, kept
+
+
+def r_hat(chain_sum, chain_square, kept):
+    """
+    Return the Gelman-Rubin statistic for each row of per-chain sums,
+    given `kept` draws per chain. Values close to 1 suggest the chains
+    have mixed; rows that never vary get 1.
+    """
+    if kept < 2 or chain_sum.shape[1] < 2:
+        return np.full(chain_sum.shape[0], np.nan)
+    means = chain_sum / kept
+    within = ((chain_square - kept * means ** 2) / (kept - 1)).mean(axis=1)
+    between = means.var(axis=1, ddof=1)
+    pooled = (kept - 1) / kept * within + between
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(within > 0, np.sqrt(pooled / within), 1.0)
+
+
+def gibbs(people, sweeps=2000, burn_in=200, chains=4, seconds=None,
+          workers=1, seed=None, probs=PROBS):
+    """
+    Estimate each person's gene and trait distributions by Gibbs
+    sampling over gene counts, which also handles pedigrees with loops.
+
+    `workers` processes each run `chains` chains. Every chain makes up
+    to `sweeps` sweeps over all people (or stops after `seconds`) and
+    discards the first `burn_in`; either budget may be None, but not
+    both. Return `(probabilities, diagnostics)`,
+    where diagnostics include the number of kept draws and the largest
+    Gelman-Rubin statistic over people.
+    """
+    if sweeps is None and seconds is None:
+        raise ValueError("need a sweep budget or a time budget")
+    pedigree = Pedigree(people, probs)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    jobs = [(pedigree, chains, sweeps, burn_in, seconds, s) for s in seeds]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_gibbs_worker, jobs))
+
+    # Workers stopped by the time budget may have kept different numbers of sweeps
+    draws = sum(r[4] * chains for r in results)
+    if draws == 0:
+        raise ValueError("no samples kept; increase the sample or time budget")
+    genes = sum(r[0] for r in results) / draws
+    has_trait = sum(r[1] for r in results) / draws
+
+    kept = min(r[4] for r in results)
+    usable = [r for r in results if r[4] == kept]
+    chain_sum = np.concatenate([r[2] for r in usable], axis=1)
+    chain_square = np.concatenate([r[3] for r in usable], axis=1)
+    rhat = r_hat(chain_sum, chain_square, kept)
+
+    diagnostics = {
+        "samples": draws,
+        "max_r_hat": float(np.nanmax(rhat)) if not np.all(np.isnan(rhat)) else float("nan"),
+    }
+    return pedigree.probabilities(genes, has_trait), diagnostics
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate gene and trait probabilities by sampling."
+    )
+    parser.add_argument("data")
+    parser.add_argument("--method", choices=["gibbs", "weighting"], default="gibbs")
+    parser.add_argument("--samples", type=int, default=None,
+                        help="samples (weighting) or sweeps per chain (gibbs); "
+                             "unlimited when only --seconds is given")
+    parser.add_argument("--seconds", type=float, default=None, help="time budget")
+    parser.add_argument("--burn-in", type=int, default=200)
+    parser.add_argument("--chains", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # Without a time budget, fall back to the default sample budgets
+    samples = args.samples
+    if samples is None and args.seconds is None:
+        samples = 100000 if args.method == "weighting" else 2000
+
+    people = load_data(args.data)
+    if args.method == "weighting":
+        probabilities, diagnostics = likelihood_weighting(
+            people, samples=samples, seconds=args.seconds,
+            workers=args.workers, seed=args.seed
+        )
+    else:
+        probabilities, diagnostics = gibbs(
+            people, sweeps=samples, burn_in=args.burn_in,
+            chains=args.chains, seconds=args.seconds, workers=args.workers,
+            seed=args.seed
+        )
+
+    for person in people:
+        print(f"{person}:")
+        for field in probabilities[person]:
+            print(f"  {field.capitalize()}:")
+            for value in probabilities[person][field]:
+                p = probabilities[person][field][value]
+                print(f"    {value}: {p:.4f}")
+    for key, value in diagnostics.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
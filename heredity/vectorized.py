@@ -0,0 +1,72 @@
+import numpy as np
+
+from heredity import PROBS
+from elimination import gene_table, inheritance_table, trait_table
+
+
+def vectorized_probabilities(people, probs=PROBS, chunk_size=65536):
+    """
+    Compute each person's gene and trait distributions by exact
+    enumeration, evaluating the joint probability of many gene
+    assignments at once.
+
+    Assignment `r` gives person `k` the `k`-th base-3 digit of `r` as
+    their number of gene copies. Rows are decoded and evaluated
+    `chunk_size` at a time, so memory stays bounded while all 3^n
+    assignments are summed. Unknown traits are summed out with the
+    trait table rather than enumerated.
+    """
+    names = list(people)
+    n = len(names)
+    column = {name: k for k, name in enumerate(names)}
+
+    prior = gene_table(probs)
+    inheritance = inheritance_table(probs)
+    traits = trait_table(probs)
+
+    founders = np.array([
+        k for k, name in enumerate(names) if people[name]["mother"] is None
+    ], dtype=np.int64)
+    children = np.array([
+        k for k, name in enumerate(names) if people[name]["mother"] is not None
+    ], dtype=np.int64)
+    mothers = np.array([column[people[names[k]]["mother"]] for k in children], dtype=np.int64)
+    fathers = np.array([column[people[names[k]]["father"]] for k in children], dtype=np.int64)
+    observed = np.array([
+        k for k, name in enumerate(names) if people[name]["trait"] is not None
+    ], dtype=np.int64)
+    observed_traits = np.array([int(people[names[k]]["trait"]) for k in observed], dtype=np.int64)
+    unobserved = np.array([
+        k for k, name in enumerate(names) if people[name]["trait"] is None
+    ], dtype=np.int64)
+
+    powers = 3 ** np.arange(n, dtype=np.int64)
+    genes = np.zeros((n, 3))
+    has_trait = np.zeros(n)
+    total = 0.0
+
+    for start in range(0, 3 ** n, chunk_size):
+        rows = np.arange(start, min(start + chunk_size, 3 ** n), dtype=np.int64)
+        g = (rows[:, None] // powers) % 3
+
+        # Joint probability of every row in the chunk
+        p = prior[g[:, founders]].prod(axis=1)
+        p *= inheritance[g[:, children], g[:, mothers], g[:, fathers]].prod(axis=1)
+        p *= traits[g[:, observed], observed_traits].prod(axis=1)
+
+        total += p.sum()
+        for copies in range(3):
+            genes[:, copies] += p @ (g == copies)
+        has_trait[unobserved] += p @ traits[g[:, unobserved], 1]
+
+    genes /= total
+    has_trait /= total
+    has_trait[observed] = observed_traits
+
+    return {
+        name: {
+            "gene": {2: float(genes[k, 2]), 1: float(genes[k, 1]), 0: float(genes[k, 0])},
+            "trait": {True: float(has_trait[k]), False: float(1 - has_trait[k])},
+        }
+        for k, name in enumerate(names)
+    }
@@ -0,0 +1,155 @@
+import argparse
+import time
+import tracemalloc
+
+from logic import *
+from bitparallel import MAX_SYMBOLS, entailed as bit_entailed
+from compiled import compile_function, compiled_check
+from generator import Puzzle
+from incremental import KnowledgeBase
+from sat import Encoder, Solver
+
+
+class Counted(Sentence):
+    """
+    Sentence that counts how many models it is evaluated in.
+    """
+
+    def __init__(self, sentence):
+        self.sentence = sentence
+        self.count = 0
+
+    def evaluate(self, model):
+        self.count += 1
+        return self.sentence.evaluate(model)
+
+    def formula(self):
+        return self.sentence.formula()
+
+    def symbols(self):
+        return self.sentence.symbols()
+
+
+def model_check_all(knowledge, queries):
+    """
+    Answer every query with `model_check`, returning the entailed
+    queries and the number of models the knowledge was evaluated in.
+    """
+    counted = Counted(knowledge)
+    return [q for q in queries if model_check(counted, q)], counted.count
+
+
+def compiled_all(knowledge, queries):
+    """
+    Answer every query with `compiled_check`, returning the entailed
+    queries and the number of models the compiled functions loop over.
+    """
+    compile_function.cache_clear()
+    models = sum(
+        2 ** len(set.union(knowledge.symbols(), q.symbols())) for q in queries
+    )
+    return [q for q in queries if compiled_check(knowledge, q)], models
+
+
+def bits_all(knowledge, queries):
+    symbols = set.union(*(q.symbols() for q in queries), knowledge.symbols())
+    return bit_entailed(knowledge, queries), 2 ** len(symbols)
+
+
+def search_work(stats):
+    """
+    Return the decisions and conflicts in solver `stats` as a summary.
+    """
+    return f"{stats['decisions']}d {stats['conflicts']}c"
+
+
+def sat_all(knowledge, queries):
+    """
+    Answer every query like `sat_check`, with one solver per query,
+    returning the entailed queries and the total search work.
+    """
+    result = []
+    stats = {"decisions": 0, "conflicts": 0}
+    for q in queries:
+        solver = Solver()
+        encoder = Encoder(solver)
+        encoder.assert_sentence(knowledge)
+        encoder.assert_sentence(Not(q))
+        if not solver.solve():
+            result.append(q)
+        for key in stats:
+            stats[key] += solver.stats[key]
+    return result, search_work(stats)
+
+
+def incremental_all(knowledge, queries):
+    """
+    Answer every query with one `KnowledgeBase`, returning the entailed
+    queries and the search work of its solver.
+    """
+    kb = KnowledgeBase(knowledge)
+    return [q for q in queries if kb.entails(q)], search_work(kb.solver.stats)
+
+
+# Backends and whether they enumerate every model
+BACKENDS = [
+    ("model_check", model_check_all, True),
+    ("compiled", compiled_all, True),
+    ("bits", bits_all, True),
+    ("sat", sat_all, False),
+    ("incremental", incremental_all, False),
+]
+
+
+def run(backend, knowledge, queries):
+    """
+    Answer `queries` once with `backend` and return the entailed queries,
+    the work done (models evaluated, or SAT decisions and conflicts),
+    the time taken and the peak memory allocated in a second, traced run.
+    """
+    start = time.perf_counter()
+    result, models = backend(knowledge, queries)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    backend(knowledge, queries)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, models, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time knights-and-knaves solvers on generated puzzles. "
+                    "Work is models evaluated, or decisions (d) and "
+                    "conflicts (c) for the SAT backends."
+    )
+    parser.add_argument("sizes", nargs="*", type=int, default=[2, 3, 4, 6, 8, 12, 16, 32, 64])
+    parser.add_argument("--statements", type=float, default=1.0,
+                        help="statements per character")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-enumeration", type=int, default=16,
+                        help="most symbols to enumerate model by model")
+    args = parser.parse_args()
+
+    print(f"{'characters':>10} {'backend':<12} {'work':>14} "
+          f"{'seconds':>9} {'peak KiB':>9} {'entailed':>8}")
+    for n in args.sizes:
+        puzzle = Puzzle(n, round(n * args.statements), seed=args.seed)
+        queries = puzzle.symbols()
+        answers = dict()
+        for name, backend, enumerates in BACKENDS:
+            limit = MAX_SYMBOLS if name == "bits" else args.max_enumeration
+            if enumerates and len(queries) > limit:
+                continue
+            result, models, elapsed, peak = run(backend, puzzle.knowledge, queries)
+            answers[name] = result
+            print(f"{n:>10} {name:<12} {models:>14} "
+                  f"{elapsed:>9.4f} {peak / 1024:>9.1f} {len(result):>8}")
+
+        if len(set(map(tuple, answers.values()))) > 1:
+            print(f"{n:>10} backends disagree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+from logic import *
+
+# Each truth table takes 2 ** n bits (2 MiB at 24 symbols), and `entailed`
+# keeps one per symbol plus the repeated subsentences still needed, so a
+# 12-character puzzle (24 symbols) peaks at about 65 MiB
+MAX_SYMBOLS = 24
+
+
+def symbol_tables(names):
+    """
+    Return the truth table of each symbol in `names` over all 2 ** n
+    models, as Python ints with one bit per model, and the table of the
+    always-true sentence.
+
+    Model `m` makes symbol `i` true when bit `i` of `m` is set, so the
+    table of symbol `i` repeats blocks of 2 ** i zeros and 2 ** i ones.
+    """
+    size = 2 ** len(names)
+    full = (1 << size) - 1
+    tables = dict()
+    for i, name in enumerate(names):
+        block = 2 ** i
+        table = ((1 << block) - 1) << block
+        width = 2 * block
+
+        # Double the pattern until it covers every model
+        while width < size:
+            table |= table << width
+            width *= 2
+        tables[name] = table
+    return tables, full
+
+
+def children(sentence):
+    """
+    Return the immediate subsentences of `sentence`.
+    """
+    if isinstance(sentence, Not):
+        return [sentence.operand]
+    if isinstance(sentence, And):
+        return sentence.conjuncts
+    if isinstance(sentence, Or):
+        return sentence.disjuncts
+    if isinstance(sentence, Implication):
+        return [sentence.antecedent, sentence.consequent]
+    if isinstance(sentence, Biconditional):
+        return [sentence.left, sentence.right]
+    return []
+
+
+def references(sentences):
+    """
+    Return how many times each compound subsentence of `sentences` is
+    needed: once per occurrence, where the parts of a repeated
+    subsentence are only counted the first time.
+    """
+    counts = dict()
+
+    def visit(sentence):
+        if isinstance(sentence, Symbol):
+            return
+        counts[sentence] = counts.get(sentence, 0) + 1
+        if counts[sentence] == 1:
+            for child in children(sentence):
+                visit(child)
+
+    for sentence in sentences:
+        visit(sentence)
+    return counts
+
+
+def truth_table(sentence, tables, full, cache=None, uses=None):
+    """
+    Return the truth table of `sentence` given the tables of its symbols,
+    computing each subsentence once for all models with bitwise
+    operations.
+
+    `cache` maps subsentences to tables and may be shared between calls.
+    Without `uses`, every subsentence is cached. With `uses` from
+    `references`, only subsentences needed again are cached, and each
+    is dropped after its last use, so only tables still needed are kept.
+    """
+    if cache is None:
+        cache = dict()
+
+    def evaluate(sentence):
+        if isinstance(sentence, Symbol):
+            return tables[sentence.name]
+        if sentence in cache:
+            table = cache[sentence]
+            if uses is not None:
+                uses[sentence] -= 1
+                if uses[sentence] == 0:
+                    del cache[sentence]
+            return table
+
+        if isinstance(sentence, Not):
+            table = full ^ evaluate(sentence.operand)
+        elif isinstance(sentence, And):
+            table = full
+            for conjunct in sentence.conjuncts:
+                table &= evaluate(conjunct)
+        elif isinstance(sentence, Or):
+            table = 0
+            for disjunct in sentence.disjuncts:
+                table |= evaluate(disjunct)
+        elif isinstance(sentence, Implication):
+            table = (full ^ evaluate(sentence.antecedent)) | evaluate(sentence.consequent)
+        elif isinstance(sentence, Biconditional):
+            table = full ^ (evaluate(sentence.left) ^ evaluate(sentence.right))
+        else:
+            raise TypeError(f"cannot evaluate {sentence!r}")
+
+        if uses is None:
+            cache[sentence] = table
+        elif uses.get(sentence, 0) > 1:
+            uses[sentence] -= 1
+            cache[sentence] = table
+        return table
+
+    return evaluate(sentence)
+
+
+def entailed(knowledge, queries):
+    """
+    Return the queries in `queries` that `knowledge` entails, in order.
+
+    The knowledge base is evaluated once over every model at the same
+    time. A query is entailed when no model of the knowledge base lies
+    outside its truth table, which is a single AND for each query.
+    Tables of repeated subsentences are kept only until their last use.
+    """
+    names = sorted(set.union(knowledge.symbols(), *(q.symbols() for q in queries)))
+    if len(names) > MAX_SYMBOLS:
+        raise ValueError(f"too many symbols for a truth table: {len(names)}")
+
+    tables, full = symbol_tables(names)
+    cache = dict()
+    uses = references([knowledge, *queries])
+    models = truth_table(knowledge, tables, full, cache, uses)
+    return [
+        query for query in queries
+        if not models & (full ^ truth_table(query, tables, full, cache, uses))
+    ]
+
+
+def bit_check(knowledge, query):
+    """
+    Return True if `knowledge` entails `query`, like `model_check`.
+    """
+    return bool(entailed(knowledge, [query]))
@@ -0,0 +1,172 @@
+import functools
+import itertools
+
+from logic import *
+
+
+class Compiler():
+
+    def __init__(self, names=()):
+        """
+        Compile sentences into the body of one flat Python function.
+
+        Identical subsentences are hash-consed into a DAG, so each is
+        computed once per model however often it repeats. Conjunctions
+        and disjunctions are keyed on their set of children, which also
+        shares `And(a, b)` with `And(b, a)`. Symbols become arguments, in
+        the order of `names` followed by any new symbols as they appear.
+        """
+        self.names = list(names)
+        self.nodes = dict()
+        self.cache = dict()
+        self.lines = []
+        for name in self.names:
+            self.nodes["symbol", name] = f"s{len(self.nodes)}"
+
+    def node(self, sentence):
+        """
+        Return the local variable holding the value of `sentence`.
+        """
+        cached = self.cache.get(id(sentence))
+        if cached is not None:
+            return cached[1]
+
+        if isinstance(sentence, Symbol):
+            key = ("symbol", sentence.name)
+            if key not in self.nodes:
+                self.names.append(sentence.name)
+                self.nodes[key] = f"s{len(self.nodes)}"
+            local = self.nodes[key]
+        elif isinstance(sentence, Not):
+            local = self.emit(("not", self.node(sentence.operand)))
+        elif isinstance(sentence, (And, Or)):
+            op = "and" if isinstance(sentence, And) else "or"
+            children = sorted(set(
+                self.node(child) for child in (
+                    sentence.conjuncts if op == "and" else sentence.disjuncts
+                )
+            ))
+            if len(children) == 1:
+                local = children[0]
+            else:
+                local = self.emit((op, *children))
+        elif isinstance(sentence, Implication):
+            local = self.emit(("implies", self.node(sentence.antecedent),
+                               self.node(sentence.consequent)))
+        elif isinstance(sentence, Biconditional):
+            local = self.emit(("iff", *sorted((self.node(sentence.left),
+                                               self.node(sentence.right)))))
+        else:
+            raise TypeError(f"cannot compile {sentence!r}")
+
+        # Keep `sentence` alive so its id is not reused
+        self.cache[id(sentence)] = (sentence, local)
+        return local
+
+    def emit(self, key):
+        """
+        Return the local variable for DAG node `key`, adding a line that
+        computes it if the node is new.
+        """
+        if key in self.nodes:
+            return self.nodes[key]
+
+        op, *args = key
+        if op == "not":
+            expression = f"not {args[0]}"
+        elif op == "and":
+            expression = " and ".join(args) if args else "True"
+        elif op == "or":
+            expression = " or ".join(args) if args else "False"
+        elif op == "implies":
+            expression = f"not {args[0]} or {args[1]}"
+        else:
+            expression = f"{args[0]} == {args[1]}"
+
+        local = f"v{len(self.nodes)}"
+        self.nodes[key] = local
+        self.lines.append(f"    {local} = {expression}")
+        return local
+
+    def function(self, result, model=False):
+        """
+        Return a function computing the expression `result` over the
+        nodes compiled so far.
+
+        The function takes one truth value per symbol in `self.names`,
+        or a model dictionary if `model` is True.
+        """
+        locals_ = [self.nodes["symbol", name] for name in self.names]
+        if model:
+            head = ["def compiled(model):"] + [
+                f"    {local} = bool(model[{name!r}])"
+                for local, name in zip(locals_, self.names)
+            ]
+        else:
+            head = [f"def compiled({', '.join(locals_)}):"]
+        source = "\n".join(head + self.lines + [f"    return {result}"])
+
+        namespace = dict()
+        exec(source, namespace)
+        return namespace["compiled"]
+
+
+class CompiledSentence(Sentence):
+
+    def __init__(self, sentence):
+        """
+        Wrap `sentence` so that `evaluate` runs compiled code.
+
+        Works anywhere a sentence is evaluated, including `model_check`.
+        """
+        self.sentence = sentence
+        compiler = Compiler()
+        self.compiled = compiler.function(compiler.node(sentence), model=True)
+        self._symbols = sentence.symbols()
+
+    def __repr__(self):
+        return f"CompiledSentence({self.sentence!r})"
+
+    def evaluate(self, model):
+        return bool(self.compiled(model))
+
+    def formula(self):
+        return self.sentence.formula()
+
+    def symbols(self):
+        return set(self._symbols)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_function(sentence, names):
+    """
+    Return a function of one truth value per symbol in the tuple `names`
+    that evaluates `sentence`.
+
+    The function returns as soon as a top-level conjunct is false, as
+    `evaluate` does. Functions are cached, so a knowledge base asked
+    several queries is compiled once.
+    """
+    compiler = Compiler(names)
+    conjuncts = sentence.conjuncts if isinstance(sentence, And) else [sentence]
+    for conjunct in conjuncts:
+        compiler.lines.append(f"    if not {compiler.node(conjunct)}: return False")
+    return compiler.function("True")
+
+
+def compiled_check(knowledge, query):
+    """
+    Return True if `knowledge` entails `query`, like `model_check`, by
+    running compiled functions over every model.
+
+    The functions take the truth values as arguments, so no model
+    dictionaries are built.
+    """
+    names = tuple(sorted(set.union(knowledge.symbols(), query.symbols())))
+    kb = compile_function(knowledge, names)
+    q = compile_function(query, names)
+    return all(
+        q(*values)
+        for values in itertools.product((True, False), repeat=len(names))
+        if kb(*values)
+    )
@@ -0,0 +1,122 @@
+import random
+import sys
+
+from logic import *
+
+
+def character_names(n):
+    """
+    Return names for `n` characters: A to Z, then C26, C27, ...
+    """
+    return [chr(ord("A") + i) if i < 26 else f"C{i}" for i in range(n)]
+
+
+class Puzzle():
+
+    def __init__(self, characters, statements=None, seed=None, max_claim=3):
+        """
+        Generate a random knights-and-knaves puzzle.
+
+        `characters` is the number of characters and `statements` the
+        number of statements they make (one per character by default).
+        Each statement is a claim about up to `max_claim` characters,
+        combined with `And`, `Or` and `Not`.
+
+        A hidden role is drawn for every character first and each claim
+        is negated if needed so that knights speak the truth and knaves
+        lie, so every generated puzzle has at least one solution.
+        """
+        self.random = random.Random(seed)
+        self.names = character_names(characters)
+        self.knights = [Symbol(f"{name} is a Knight") for name in self.names]
+        self.knaves = [Symbol(f"{name} is a Knave") for name in self.names]
+        self.roles = [self.random.random() < 0.5 for _ in self.names]
+        self.max_claim = max_claim
+        self.statements = []
+
+        self.knowledge = And()
+        for knight, knave in zip(self.knights, self.knaves):
+            self.knowledge.add(Or(knight, knave))
+            self.knowledge.add(Not(And(knight, knave)))
+
+        if statements is None:
+            statements = characters
+        for _ in range(statements):
+            self.statement()
+
+    def symbols(self):
+        """
+        Return every symbol of the puzzle, two per character.
+        """
+        return [s for pair in zip(self.knights, self.knaves) for s in pair]
+
+    def solution(self):
+        """
+        Return the hidden roles as a model dictionary.
+        """
+        model = dict()
+        for knight, knave, role in zip(self.knights, self.knaves, self.roles):
+            model[knight.name] = role
+            model[knave.name] = not role
+        return model
+
+    def claim(self, size):
+        """
+        Return a random sentence about `size` characters.
+        """
+        if size == 1:
+            i = self.random.randrange(len(self.names))
+            return self.random.choice([self.knights, self.knaves])[i]
+
+        left = self.random.randint(1, size - 1)
+        parts = [self.claim(left), self.claim(size - left)]
+        kind = self.random.choice(["and", "or", "nand", "nor"])
+        if kind == "and":
+            return And(*parts)
+        elif kind == "or":
+            return Or(*parts)
+        elif kind == "nand":
+            return Not(And(*parts))
+        return Not(Or(*parts))
+
+    def statement(self):
+        """
+        Add a random statement to the knowledge: a speaker who is a
+        knight if and only if their claim is true.
+        """
+        speaker = self.random.randrange(len(self.names))
+        claim = self.claim(self.random.randint(1, self.max_claim))
+        if claim.evaluate(self.solution()) != self.roles[speaker]:
+            claim = Not(claim)
+        self.statements.append((self.names[speaker], claim))
+
+        # Same form as the puzzles in puzzle.py
+        self.knowledge.add(Or(
+            And(self.knights[speaker], claim),
+            And(self.knaves[speaker], Not(claim)),
+        ))
+
+
+def main():
+
+    # Check usage
+    if len(sys.argv) not in [2, 3, 4]:
+        sys.exit("Usage: python generator.py characters [statements] [seed]")
+    characters = int(sys.argv[1])
+    statements = int(sys.argv[2]) if len(sys.argv) >= 3 else None
+    seed = int(sys.argv[3]) if len(sys.argv) == 4 else None
+
+    puzzle = Puzzle(characters, statements, seed)
+    for name, claim in puzzle.statements:
+        print(f"{name} says \"{claim.formula()}\"")
+
+    from incremental import KnowledgeBase
+    kb = KnowledgeBase(puzzle.knowledge)
+    print("Solution")
+    for symbol in puzzle.symbols():
+        if kb.entails(symbol):
+            print(f"    {symbol}")
+
+
+if __name__ == "__main__":
+    main()
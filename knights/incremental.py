@@ -0,0 +1,63 @@
+from logic import *
+from sat import Encoder, Solver
+
+
+class KnowledgeBase():
+
+    def __init__(self, *sentences):
+        """
+        Create a knowledge base that grows one sentence at a time and
+        answers entailment queries with one long-lived SAT solver.
+
+        Clauses learned while answering a query are implied by the
+        knowledge alone, so they are kept and speed up later queries.
+        Queries and assumptions are passed to the solver as assumptions
+        rather than added as clauses, so they leave the knowledge
+        unchanged.
+        """
+        self.solver = Solver()
+        self.encoder = Encoder(self.solver)
+        self.sentences = []
+        for sentence in sentences:
+            self.add(sentence)
+
+    def add(self, sentence):
+        """
+        Add `sentence` to the knowledge base.
+        """
+        self.sentences.append(sentence)
+        self.encoder.assert_sentence(sentence)
+
+    def consistent(self, assumptions=()):
+        """
+        Return True if the knowledge base, together with every sentence in
+        `assumptions`, has a model.
+        """
+        literals = [self.encoder.literal(sentence) for sentence in assumptions]
+        return self.solver.solve(literals)
+
+    def entails(self, query, assumptions=()):
+        """
+        Return True if the knowledge base, together with every sentence in
+        `assumptions`, entails `query`.
+        """
+        return not self.consistent(list(assumptions) + [Not(query)])
+
+    def model(self, assumptions=()):
+        """
+        Return a dictionary from symbol names to truth values for one
+        model of the knowledge base and `assumptions`, or None if there
+        is no model.
+        """
+        if not self.consistent(assumptions):
+            return None
+        return {
+            name: bool(self.solver.assigns[var])
+            for name, var in self.encoder.variables.items()
+        }
+
+    def knowledge(self):
+        """
+        Return the knowledge base as one sentence.
+        """
+        return And(*self.sentences)
@@ -1,4 +1,10 @@
+import sys
+
 from logic import *
+from bitparallel import entailed as bit_entailed
+from compiled import compiled_check
+from incremental import KnowledgeBase
+from sat import sat_check
 
 AKnight = Symbol("A is a Knight")
 AKnave = Symbol("A is a Knave")
@@ -163,7 +169,41 @@ knowledge3 = And(
 )
 
 
+def check_each(check):
+    """
+    Return an `entailed(knowledge, symbols)` function that asks
+    `check(knowledge, symbol)` about each symbol in turn.
+    """
+    def entailed(knowledge, symbols):
+        return [symbol for symbol in symbols if check(knowledge, symbol)]
+    return entailed
+
+
+def incremental_entailed(knowledge, symbols):
+    """
+    Return the symbols entailed by `knowledge`, asking one incremental
+    knowledge base about every symbol.
+    """
+    kb = KnowledgeBase(knowledge)
+    return [symbol for symbol in symbols if kb.entails(symbol)]
+
+
+# Ways to find the entailed symbols, by command-line name
+METHODS = {
+    "model_check": check_each(model_check),
+    "sat": check_each(sat_check),
+    "compiled": check_each(compiled_check),
+    "bits": bit_entailed,
+    "incremental": incremental_entailed,
+}
+
+
 def main():
+    method = sys.argv[1] if len(sys.argv) == 2 else "model_check"
+    if method not in METHODS:
+        sys.exit(f"Unknown method: {method}")
+    entailed = METHODS[method]
+
     symbols = [AKnight, AKnave, BKnight, BKnave, CKnight, CKnave]
     puzzles = [
         ("Puzzle 0", knowledge0),
@@ -176,9 +216,8 @@ def main():
         if len(knowledge.conjuncts) == 0:
             print("    Not yet implemented.")
         else:
-            for symbol in symbols:
-                if model_check(knowledge, symbol):
-                    print(f"    {symbol}")
+            for symbol in entailed(knowledge, symbols):
+                print(f"    {symbol}")
 
 
 if __name__ == "__main__":
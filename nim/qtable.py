@@ -0,0 +1,240 @@
+import os
+import random
+
+import numpy as np
+
+from nim import NimAI
+
+
+class QTable():
+
+    def __init__(self, initial=[1, 3, 5, 7]):
+        """
+        Initialize a dense Q-table for every pile configuration that can
+        be reached from `initial`.
+
+        Each configuration is mapped to an integer index with a
+        mixed-radix encoding: pile `i` is a digit with radix
+        `initial[i] + 1`. Each action `(i, j)` is mapped to the column
+        `offsets[i] + j - 1`, so there are `sum(initial)` columns.
+        """
+        self.initial = list(initial)
+        radix = np.array(self.initial, dtype=np.int64) + 1
+
+        # Place value of each pile in the state index
+        self.strides = np.ones(len(radix), dtype=np.int64)
+        for i in range(len(radix) - 2, -1, -1):
+            self.strides[i] = self.strides[i + 1] * radix[i + 1]
+        self.num_states = int(np.prod(radix))
+
+        # Pile and count of every action column
+        self.offsets = np.concatenate(([0], np.cumsum(self.initial)[:-1])).astype(np.int64)
+        self.action_pile = np.repeat(np.arange(len(radix)), self.initial)
+        self.action_count = np.concatenate(
+            [np.arange(1, pile + 1) for pile in self.initial]
+        ).astype(np.int64)
+        self.num_actions = len(self.action_pile)
+
+        # Pile sizes of every state, and which actions are legal in it
+        index = np.arange(self.num_states)
+        self.piles = (index[:, None] // self.strides) % radix
+        self.valid = self.piles[:, self.action_pile] >= self.action_count
+
+        # Index of the state each (state, action) pair leads to
+        self.next_state = np.where(
+            self.valid,
+            index[:, None] - self.action_count * self.strides[self.action_pile],
+            -1,
+        )
+
+        # Python-side copies for fast single-state lookups
+        self.legal = [np.flatnonzero(row) for row in self.valid]
+        self._strides = self.strides.tolist()
+        self._offsets = self.offsets.tolist()
+
+        self.values = np.zeros((self.num_states, self.num_actions))
+        self.visits = np.zeros((self.num_states, self.num_actions), dtype=np.int64)
+
+    def save(self, filename):
+        """
+        Save the Q-values and visit counts to a compressed `.npz` file
+        at exactly `filename`.
+
+        The file is written under a temporary name and then renamed, so
+        an interrupted save leaves any previous checkpoint intact.
+        """
+        partial = f"{filename}.partial"
+        with open(partial, "wb") as f:
+            np.savez_compressed(
+                f,
+                initial=np.array(self.initial),
+                values=self.values,
+                visits=self.visits,
+            )
+        os.replace(partial, filename)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load a Q-table saved with `QTable.save`.
+        """
+        with np.load(filename) as data:
+            table = cls(data["initial"].tolist())
+            table.values[...] = data["values"]
+            table.visits[...] = data["visits"]
+        return table
+
+    def state_index(self, state):
+        """
+        Return the integer index of the pile configuration `state`.
+        """
+        index = 0
+        for pile, stride in zip(state, self._strides):
+            index += pile * stride
+        return index
+
+    def action_index(self, action):
+        """
+        Return the column of action `(i, j)`.
+        """
+        i, j = action
+        return self._offsets[i] + j - 1
+
+    def action(self, column):
+        """
+        Return the action `(i, j)` stored in column `column`.
+        """
+        return (int(self.action_pile[column]), int(self.action_count[column]))
+
+    def __getitem__(self, key):
+        state, action = key
+        return self.values[self.state_index(state), self.action_index(action)]
+
+    def __setitem__(self, key, value):
+        state, action = key
+        self.values[self.state_index(state), self.action_index(action)] = value
+
+    def __contains__(self, key):
+        state, action = key
+        if len(state) != len(self.initial):
+            return False
+        i, j = action
+        return 0 <= i < len(state) and 1 <= j <= state[i] <= self.initial[i]
+
+    def __len__(self):
+        return int(self.valid.sum())
+
+    def masked(self, states):
+        """
+        Return the Q-values of `states` (an index or array of indices),
+        with illegal actions set to -inf.
+        """
+        return np.where(self.valid[states], self.values[states], -np.inf)
+
+    def best_future_reward(self, states):
+        """
+        Return the maximum Q-value available in `states`, or 0 when that
+        maximum is negative or there are no actions.
+        """
+        return np.maximum(self.masked(states).max(axis=-1), 0)
+
+    def best_actions(self, states):
+        """
+        Return the column of the highest-valued legal action in `states`.
+        Ties go to the lowest column.
+        """
+        return self.masked(states).argmax(axis=-1)
+
+
+class ArrayNimAI(NimAI):
+
+    def __init__(self, alpha=0.5, epsilon=0.1, initial=[1, 3, 5, 7]):
+        """
+        Initialize a Q-learning AI whose Q-values live in a `QTable`
+        for pile configurations reachable from `initial`.
+
+        `self.q` still supports `self.q[state, action]` lookups.
+        """
+        super().__init__(alpha=alpha, epsilon=epsilon)
+        self.q = QTable(initial)
+
+    @classmethod
+    def load(cls, filename, alpha=0.5, epsilon=0.1):
+        """
+        Create an AI from a Q-table checkpoint saved with `QTable.save`.
+        """
+        table = QTable.load(filename)
+        ai = cls(alpha=alpha, epsilon=epsilon, initial=table.initial)
+        ai.q = table
+        return ai
+
+    def update(self, old_state, action, new_state, reward):
+        """
+        Update Q-learning model, given an old state, an action taken
+        in that state, a new resulting state, and the reward received
+        from taking that action.
+
+        Encodes each state once instead of once per lookup.
+        """
+        values = self.q.values
+        s = self.q.state_index(old_state)
+        a = self.q.action_index(action)
+        new = self.q.state_index(new_state)
+
+        old = values[s, a]
+        legal = self.q.legal[new]
+        best_future = max(values[new, legal].max(), 0) if len(legal) else 0
+        values[s, a] = old + self.alpha * (reward + best_future - old)
+        self.q.visits[s, a] += 1
+
+    def get_q_value(self, state, action):
+        """
+        Return the Q-value for the state `state` and the action `action`.
+        """
+        return float(self.q[state, action])
+
+    def update_q_value(self, state, action, old_q, reward, future_rewards):
+        """
+        Update the Q-value for the state `state` and the action `action`.
+        """
+        self.q[state, action] = old_q + self.alpha * (reward + future_rewards - old_q)
+
+    def best_future_reward(self, state):
+        """
+        Return the maximum Q-value available in `state`, using 0 if
+        there are no available actions.
+        """
+        index = self.q.state_index(state)
+        legal = self.q.legal[index]
+        if len(legal) == 0:
+            return 0
+        return max(float(self.q.values[index, legal].max()), 0)
+
+    def choose_action(self, state, epsilon=True):
+        """
+        Given a state `state`, return an action `(i, j)` to take,
+        choosing randomly with probability `self.epsilon` when
+        `epsilon` is True and the best action otherwise.
+
+        Random actions are drawn like `NimAI` draws them: a non-empty
+        pile uniformly, then a count from that pile uniformly.
+        """
+        if epsilon == True and random.random() <= self.epsilon:
+            return self.explore(state)
+
+        index = self.q.state_index(state)
+        legal = self.q.legal[index]
+        values = self.q.values[index, legal]
+        best = values.argmax()
+        if values[best] <= -1:
+            return self.explore(state)
+        return self.q.action(legal[best])
+
+    def explore(self, state):
+        """
+        Return a random action in `state`, with the same distribution as
+        the random actions of `NimAI.choose_action`.
+        """
+        i = random.choice([idx for idx in range(len(state)) if state[idx] != 0])
+        j = random.randint(1, state[i])
+        return (i, j)
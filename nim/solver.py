@@ -0,0 +1,130 @@
+import argparse
+import functools
+
+import numpy as np
+
+from batch import train_batch
+from qtable import ArrayNimAI, QTable
+
+
+def nim_sum(piles):
+    """
+    Return the nim-sum (bitwise xor) of `piles`, which is the
+    Sprague-Grundy value of the position under normal play.
+    """
+    return functools.reduce(lambda a, b: a ^ b, piles, 0)
+
+
+def is_winning(piles):
+    """
+    Return True if the player to move wins `piles` with perfect play.
+
+    `Nim` is played misere: whoever takes the last object loses. While
+    some pile has more than one object this matches normal play, so the
+    position is won exactly when the nim-sum is not 0. Once every pile
+    has at most one object, it is won exactly when the nim-sum is 0
+    (an even number of single objects remain, including none at all).
+    """
+    if max(piles, default=0) <= 1:
+        return nim_sum(piles) == 0
+    return nim_sum(piles) != 0
+
+
+def optimal_actions(piles):
+    """
+    Return the set of actions `(i, j)` in `piles` that leave the other
+    player in a losing position. The set is empty if `piles` is lost.
+    """
+    actions = set()
+    for i, pile in enumerate(piles):
+        for j in range(1, pile + 1):
+            after = list(piles)
+            after[i] -= j
+            if not is_winning(after):
+                actions.add((i, j))
+    return actions
+
+
+def winning_table(table):
+    """
+    Return a boolean array over every state of the `QTable` `table`,
+    True where the player to move wins with perfect play.
+    """
+    sums = np.bitwise_xor.reduce(table.piles, axis=1)
+    small = table.piles.max(axis=1, initial=0) <= 1
+    return np.where(small, sums == 0, sums != 0)
+
+
+def optimal_table(table):
+    """
+    Return a boolean array of shape (states, actions), True where the
+    action is legal and leaves the other player in a losing position.
+    """
+    winning = winning_table(table)
+    return table.valid & ~winning[np.maximum(table.next_state, 0)]
+
+
+def as_table(ai, initial=[1, 3, 5, 7]):
+    """
+    Return the Q-values of `ai` as a `QTable`, copying them out of
+    a dictionary-based `NimAI` if needed.
+    """
+    if isinstance(ai.q, QTable):
+        return ai.q
+    table = QTable(initial)
+    for (state, action), value in ai.q.items():
+        table[state, action] = value
+    return table
+
+
+def agreement(ai, initial=[1, 3, 5, 7]):
+    """
+    Return the fraction of winning states reachable from `initial` in
+    which the greedy action of `ai` is an optimal move.
+
+    Losing states are skipped, since every move in them loses.
+    """
+    table = as_table(ai, initial)
+    optimal = optimal_table(table)
+    winning = optimal.any(axis=1)
+    greedy = table.best_actions(np.arange(table.num_states))
+    chosen = optimal[np.arange(table.num_states), greedy]
+    return float(chosen[winning].mean())
+
+
+def optimality_curve(checkpoints, batch=64, seed=None, initial=[1, 3, 5, 7]):
+    """
+    Train one AI with `train_batch`, measuring its agreement with
+    optimal play after each number of games in `checkpoints`.
+
+    Return a list of `(games, agreement)` pairs.
+    """
+    player = ArrayNimAI(initial=initial)
+    rng = np.random.default_rng(seed)
+    curve = []
+    played = 0
+    for games in sorted(checkpoints):
+        train_batch(games - played, batch=batch, report=0, player=player,
+                    seed=rng.integers(2 ** 32))
+        played = games
+        curve.append((games, agreement(player, initial)))
+    return curve
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Chart how close a trained Nim AI gets to optimal play."
+    )
+    parser.add_argument("games", type=int, nargs="*",
+                        default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    for games, score in optimality_curve(args.games, args.batch, args.seed):
+        bar = "#" * round(50 * score)
+        print(f"{games:>10} {100 * score:6.2f}% {bar}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from columnar import COLUMNS, parse, read_header, to_arrays
+
+CHUNK_ROWS = 100000
+
+
+def scan(filename):
+    """
+    Return the SHA-256 checksum of `filename` and its number of data
+    rows (non-blank lines after the header), reading it once.
+    """
+    digest = hashlib.sha256()
+    rows = -1
+    with open(filename, "rb") as f:
+        for line in f:
+            digest.update(line)
+            if line.strip():
+                rows += 1
+    return digest.hexdigest(), max(rows, 0)
+
+
+def cache_paths(filename, cache=None):
+    """
+    Return the paths of the matrix and metadata files caching `filename`.
+    """
+    cache = cache or filename + ".npy"
+    return cache, cache + ".json"
+
+
+def build_cache(filename, cache=None, chunk_rows=CHUNK_ROWS):
+    """
+    Convert the CSV file `filename` into a `.npy` matrix at `cache`,
+    parsing `chunk_rows` rows at a time so the whole file is never held
+    in memory, and record the checksum of the source next to it. If
+    anything fails, the partly written matrix is removed.
+
+    Return the metadata dictionary.
+    """
+    cache, meta_path = cache_paths(filename, cache)
+    checksum, rows = scan(filename)
+
+    partial = cache + ".partial"
+    try:
+        matrix = np.lib.format.open_memmap(
+            partial, mode="w+", dtype=np.float64, shape=(rows, len(COLUMNS))
+        )
+        written = 0
+        with open(filename) as f:
+            read_header(f, filename)
+            while True:
+                chunk = list(itertools.islice(f, chunk_rows))
+                if not chunk:
+                    break
+                values = parse(chunk)
+                matrix[written:written + len(values)] = values
+                written += len(values)
+        if written != rows:
+            raise ValueError(f"{filename} changed while it was being cached")
+        matrix.flush()
+        del matrix
+        os.replace(partial, cache)
+    finally:
+        # Never leave a half-written matrix behind
+        try:
+            os.remove(partial)
+        except FileNotFoundError:
+            pass
+
+    stat = os.stat(filename)
+    meta = {
+        "source": os.path.abspath(filename),
+        "sha256": checksum,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "rows": rows,
+        "columns": COLUMNS,
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=4)
+    return meta
+
+
+def cache_valid(filename, cache=None):
+    """
+    Return True if the cache of `filename` exists and was built from the
+    file's current contents.
+
+    The checksum is only recomputed when the size or modification time
+    differ from those recorded.
+    """
+    cache, meta_path = cache_paths(filename, cache)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not os.path.exists(cache) or meta.get("columns") != COLUMNS:
+        return False
+
+    stat = os.stat(filename)
+    if stat.st_size != meta["size"]:
+        return False
+    if stat.st_mtime_ns == meta["mtime_ns"]:
+        return True
+    if scan(filename)[0] != meta["sha256"]:
+        return False
+
+    # Same contents, so remember the new modification time
+    meta["mtime_ns"] = stat.st_mtime_ns
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=4)
+    return True
+
+
+def load_cached(filename, cache=None):
+    """
+    Load shopping data from a CSV file `filename` through its binary
+    cache, building the cache first if it is missing or stale. Return a
+    tuple (evidence, labels).
+
+    The matrix is memory-mapped, so evidence is read from disk on demand
+    without being copied.
+    """
+    if not cache_valid(filename, cache):
+        build_cache(filename, cache)
+    matrix = np.load(cache_paths(filename, cache)[0], mmap_mode="r")
+    return to_arrays(matrix)
+
+
+def main():
+
+    # Check command-line arguments
+    if len(sys.argv) not in [2, 3]:
+        sys.exit("Usage: python cache.py data [cache]")
+    filename = sys.argv[1]
+    cache = sys.argv[2] if len(sys.argv) == 3 else None
+
+    start = time.perf_counter()
+    meta = build_cache(filename, cache)
+    print(f"Cached {meta['rows']} rows in {time.perf_counter() - start:.3f}s")
+    print(f"Checksum: {meta['sha256']}")
+
+    start = time.perf_counter()
+    evidence, labels = load_cached(filename, cache)
+    print(f"Memory-mapped load: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import sys
+import time
+
+import numpy as np
+
+# Evidence columns, in order, followed by the label
+COLUMNS = [
+    "Administrative", "Administrative_Duration",
+    "Informational", "Informational_Duration",
+    "ProductRelated", "ProductRelated_Duration",
+    "BounceRates", "ExitRates", "PageValues", "SpecialDay",
+    "Month", "OperatingSystems", "Browser", "Region", "TrafficType",
+    "VisitorType", "Weekend", "Revenue",
+]
+
+FLOATING = [1, 3, 5, 6, 7, 8, 9]
+
+# Lookup tables for the text columns
+MONTHS = {
+    month: index for index, month in enumerate([
+        'Jan', 'Feb', 'Mar', 'Apr', 'May', 'June', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
+    ])
+}
+VISITORS = {'Returning_Visitor': 1, 'New_Visitor': 0, 'Other': 0}
+BOOLEANS = {'TRUE': 1, 'FALSE': 0}
+LOOKUPS = {10: MONTHS, 15: VISITORS, 16: BOOLEANS, 17: BOOLEANS}
+
+
+def record_dtype():
+    """
+    Return the record layout used for parsing: each numeric column is a
+    float64 at the offset it has in a row of the output matrix, and each
+    text column is a byte string after them, one byte longer than its
+    longest known value so that longer unknown values cannot match.
+    """
+    formats, offsets = [], []
+    end = 8 * len(COLUMNS)
+    for idx in range(len(COLUMNS)):
+        if idx in LOOKUPS:
+            width = max(map(len, LOOKUPS[idx])) + 1
+            formats.append(f"S{width}")
+            offsets.append(end)
+            end += width
+        else:
+            formats.append(np.float64)
+            offsets.append(8 * idx)
+    return np.dtype({
+        "names": COLUMNS, "formats": formats, "offsets": offsets, "itemsize": end
+    })
+
+
+DTYPE = record_dtype()
+
+
+def lookup(column, table, name):
+    """
+    Map each byte string in `column` through `table` with one binary
+    search over the table's keys, without calling Python per value.
+    """
+    keys = np.array(sorted(table), dtype=column.dtype)
+    codes = np.array([table[key.decode()] for key in keys.tolist()])
+    positions = np.minimum(np.searchsorted(keys, column), len(keys) - 1)
+    unknown = keys[positions] != column
+    if unknown.any():
+        value = column[unknown.argmax()].decode()
+        raise ValueError(f"unknown {name} value: {value!r}")
+    return codes[positions]
+
+
+def parse(lines):
+    """
+    Parse CSV data `lines` (a file, or any iterable of lines without the
+    header) into a float64 matrix with one row per session and one
+    column per entry of `COLUMNS`.
+
+    NumPy's C parser reads every field in one pass, numbers as floats
+    and text as fixed-width bytes. The numeric fields are laid out like
+    a row of the matrix, so they are copied out in one go, and each text
+    column is then mapped through its lookup table.
+    """
+    records = np.loadtxt(lines, delimiter=",", comments=None, dtype=DTYPE, ndmin=1)
+    matrix = np.ndarray(
+        (len(records), len(COLUMNS)), dtype=np.float64,
+        buffer=records, strides=(DTYPE.itemsize, 8),
+    ).copy()
+    for idx, table in LOOKUPS.items():
+        matrix[:, idx] = lookup(records[COLUMNS[idx]], table, COLUMNS[idx])
+    return matrix
+
+
+def read_header(f, filename):
+    """
+    Read the header line of the open CSV file `f` and check its columns.
+    """
+    header = next(f).strip().split(",")
+    if header != COLUMNS:
+        raise ValueError(f"unexpected columns in {filename}")
+
+
+def load_matrix(filename):
+    """
+    Load shopping data from a CSV file `filename` as a float64 matrix
+    with one column per entry of `COLUMNS`.
+    """
+    with open(filename) as f:
+        read_header(f, filename)
+        return parse(f)
+
+
+def to_columns(matrix):
+    """
+    Return a dictionary from column name to a typed array for `matrix`:
+    int64 for counts, codes and flags, float64 for durations and rates.
+    """
+    return {
+        name: matrix[:, idx] if idx in FLOATING else matrix[:, idx].astype(np.int64)
+        for idx, name in enumerate(COLUMNS)
+    }
+
+
+def to_arrays(matrix):
+    """
+    Return `(evidence, labels)` for `matrix`. Evidence is a float64 view
+    of the matrix, which `train_model` uses without copying, and labels
+    are an int64 vector.
+    """
+    return matrix[:, :-1], matrix[:, -1].astype(np.int64)
+
+
+def load_columns(filename):
+    """
+    Load shopping data from a CSV file `filename` into a dictionary from
+    column name to a typed NumPy array.
+    """
+    return to_columns(load_matrix(filename))
+
+
+def load_arrays(filename):
+    """
+    Load shopping data from a CSV file `filename` as NumPy arrays, in
+    the same order and encoding as `load_data`. Return a tuple
+    (evidence, labels).
+    """
+    return to_arrays(load_matrix(filename))
+
+
+def main():
+
+    # Check command-line arguments
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python columnar.py data")
+
+    from shopping import load_data
+
+    start = time.perf_counter()
+    evidence, labels = load_arrays(sys.argv[1])
+    fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected, expected_labels = load_data(sys.argv[1])
+    slow = time.perf_counter() - start
+
+    assert np.array_equal(evidence, np.array(expected, dtype=np.float64))
+    assert np.array_equal(labels, np.array(expected_labels))
+    print(f"Rows: {len(labels)}")
+    print(f"load_data: {slow:.3f}s")
+    print(f"load_arrays: {fast:.3f}s ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
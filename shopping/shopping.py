@@ -4,6 +4,9 @@ import sys
 from sklearn.model_selection import train_test_split
 from sklearn.neighbors import KNeighborsClassifier
 
+from cache import load_cached
+from columnar import load_arrays
+
 TEST_SIZE = 0.4
 
 
@@ -13,8 +16,12 @@ def main():
     if len(sys.argv) != 2:
         sys.exit("Usage: python shopping.py data")
 
-    # Load data from spreadsheet and split into train and test sets
-    evidence, labels = load_data(sys.argv[1])
+    # Load data from spreadsheet, through the binary cache unless it
+    # cannot be written, and split into train and test sets
+    try:
+        evidence, labels = load_cached(sys.argv[1])
+    except OSError:
+        evidence, labels = load_arrays(sys.argv[1])
     X_train, X_test, y_train, y_test = train_test_split(
         evidence, labels, test_size=TEST_SIZE
     )
@@ -79,7 +86,7 @@ def load_data(filename):
                     return 1 if c == 'Returning_Visitor' else 0
             
                 if idx == 16:
-                    return 1 if bool(c) else 0
+                    return 1 if c == 'TRUE' else 0
 
                 assert idx == 10
                 month = [
@@ -90,7 +97,7 @@ def load_data(filename):
             evidence.append([
                     typer(idx, row[idx]) for idx in range(len(row) - 1)
                 ])
-            labels.append(1 if bool(row[-1]) else 0)
+            labels.append(1 if row[-1] == 'TRUE' else 0)
         return evidence, labels
 
 